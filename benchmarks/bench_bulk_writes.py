@@ -0,0 +1,144 @@
+"""
+Compare the bulk writers in database.write against the previous per row
+path, where update_questions, update_responses and update_users_stats ran
+one cursor.execute per row.
+
+    python -m benchmarks.bench_bulk_writes [n_rows ...]
+"""
+
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from polymarket_predictions_tally.database.benchmark import make_questions
+from polymarket_predictions_tally.database.utils import load_sql_query
+from polymarket_predictions_tally.database.write import (
+    question_row,
+    upsert_questions,
+    update_responses,
+    update_users_stats,
+)
+from polymarket_predictions_tally.logic import Question, Response, User
+
+
+def legacy_upsert_questions(conn: sqlite3.Connection, questions: list[Question]):
+    cursor = conn.cursor()
+    for question in questions:
+        cursor.execute(load_sql_query("upsert_question.sql"), question_row(question))
+    conn.commit()
+
+
+def legacy_update_responses(
+    conn: sqlite3.Connection, responses: list[list[Response]], questions: list[Question]
+):
+    cursor = conn.cursor()
+    query = load_sql_query("update_response.sql")
+    for question, responses_to_question in zip(questions, responses):
+        correct_answer = "Yes" if question.outcome else "No"
+        for response in responses_to_question:
+            correct = response.answer == correct_answer
+            cursor.execute(
+                query, (correct, question.id, response.user_id, response.timestamp)
+            )
+
+
+def legacy_update_users_stats(
+    conn: sqlite3.Connection, update_info: dict[User, list[tuple[Response, bool]]]
+):
+    cursor = conn.cursor()
+    query = load_sql_query("update_user_stats.sql")
+    for user, info in update_info.items():
+        right_count = sum([correct for _, correct in info])
+        cursor.execute(query, (right_count, len(info) - right_count, user.id))
+
+
+def make_rows(n: int):
+    start = datetime(2025, 1, 1)
+    questions = make_questions(n, 1.0, outcome=True)
+    # one response per question, spread over a hundred users
+    responses = [
+        [Response(i % 100, i, "Yes", start + timedelta(seconds=i), None, None)]
+        for i in range(n)
+    ]
+    users = {User(i, f"user{i}", 100): [(None, True), (None, False)] for i in range(n)}
+    return questions, responses, users
+
+
+def setup_db(path: Path, questions, responses, users) -> sqlite3.Connection:
+    path.unlink(missing_ok=True)
+    conn = sqlite3.connect(path)
+    conn.executescript(load_sql_query("setup.sql"))
+    conn.executemany(
+        load_sql_query("insert_question.sql"),
+        [question_row(question) for question in questions],
+    )
+    conn.executemany(
+        "INSERT INTO responses (user_id, question_id, answer, timestamp) "
+        "VALUES (?, ?, ?, ?)",
+        [
+            (r.user_id, r.question_id, r.answer, r.timestamp)
+            for group in responses
+            for r in group
+        ],
+    )
+    conn.executemany(
+        "INSERT INTO stats VALUES (?, 0, 0)", [(user.id,) for user in users]
+    )
+    conn.commit()
+    return conn
+
+
+def timed(path: Path, rows, writer, *args, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        conn = setup_db(path, *rows)
+        start = time.perf_counter()
+        writer(conn, *args)
+        conn.commit()
+        best = min(best, time.perf_counter() - start)
+        conn.close()
+    return best
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        for n in sizes:
+            rows = make_rows(n)
+            questions, responses, users = rows
+            cases = [
+                (
+                    "update_questions",
+                    legacy_upsert_questions,
+                    upsert_questions,
+                    (questions,),
+                ),
+                (
+                    "update_responses",
+                    legacy_update_responses,
+                    update_responses,
+                    (responses, questions),
+                ),
+                (
+                    "update_users_stats",
+                    legacy_update_users_stats,
+                    update_users_stats,
+                    (users,),
+                ),
+            ]
+            print(f"rows: {n}")
+            for name, legacy_writer, bulk_writer, args in cases:
+                legacy = timed(path, rows, legacy_writer, *args)
+                bulk = timed(path, rows, bulk_writer, *args)
+                print(
+                    f"  {name:<20} per row {legacy * 1000:8.1f} ms"
+                    f"  bulk {bulk * 1000:8.1f} ms ({legacy / bulk:.2f}x)"
+                )
+
+
+if __name__ == "__main__":
+    main()
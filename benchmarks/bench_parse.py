@@ -0,0 +1,121 @@
+"""
+Compare the single pass market parser against the previous parsing path,
+where get_question_from_entry and get_resolved_outcome each decoded the
+dates and JSON fields of every entry.
+
+    python -m benchmarks.bench_parse [n_entries]
+"""
+
+import copy
+import json
+import sys
+import time
+from datetime import datetime, timezone
+
+from polymarket_predictions_tally.api import get_questions_from_data
+from polymarket_predictions_tally.logic import Question
+
+
+def legacy_get_resolved_outcome(entry: dict) -> bool | None:
+    resolved_status = entry.get("umaResolutionStatus")
+    if resolved_status is not None and resolved_status != "resolved":
+        return None
+    try:
+        end_date = datetime.fromisoformat(entry["endDate"].replace("Z", "+00:00"))
+    except:
+        try:
+            end_date = datetime.fromisoformat(entry["endDateIso"])
+        except:
+            end_date = None
+    if end_date is not None and end_date.tzinfo is None:
+        end_date = end_date.replace(tzinfo=timezone.utc)
+    if end_date is not None and end_date > datetime.now(timezone.utc):
+        return None
+    try:
+        outcome_prices = json.loads(entry["outcomePrices"])
+        outcomes = json.loads(entry["outcomes"])
+        winning_idx = next(
+            (i for i, price in enumerate(outcome_prices) if price == "1"), None
+        )
+        if winning_idx is None or winning_idx >= len(outcomes):
+            return None
+        return outcomes[winning_idx] == "Yes"
+    except (KeyError, json.JSONDecodeError):
+        return None
+
+
+def legacy_get_question_from_entry(entry: dict, tag: str) -> Question | None:
+    try:
+        end_date = datetime.fromisoformat(entry["endDate"].replace("Z", "+00:00"))
+    except:
+        try:
+            end_date = datetime.fromisoformat(entry["endDateIso"])
+        except:
+            return None
+    return Question(
+        id=int(entry["id"]),
+        question=entry["question"],
+        outcome_probs=[float(p) for p in json.loads(entry["outcomePrices"])],
+        outcomes=json.loads(entry["outcomes"]),
+        tag=tag,
+        outcome=legacy_get_resolved_outcome(entry),
+        end_date=end_date,
+        description=entry["description"],
+    )
+
+
+def legacy_get_questions_from_data(tag: str, data: list[dict]) -> list[Question]:
+    questions = []
+    for entry in data:
+        if not entry.get("active"):
+            continue
+        question = legacy_get_question_from_entry(entry, tag)
+        if question:
+            questions.append(question)
+    return questions
+
+
+def make_entries(n: int) -> list[dict]:
+    with open("example_market1.json", encoding="utf-8") as f:
+        template = json.load(f)
+    # the recorded entry was pretty printed, the api sends these encoded
+    template["outcomes"] = json.dumps(template["outcomes"])
+    template["outcomePrices"] = json.dumps(template["outcomePrices"])
+    template["endDate"] = "2100-12-31T12:00:00Z"
+    # half open, half resolved so both outcome branches are exercised
+    resolved = copy.deepcopy(template)
+    resolved["endDate"] = "2024-11-05T12:00:00Z"
+    resolved["outcomePrices"] = '["1", "0"]'
+    resolved["umaResolutionStatus"] = "resolved"
+    entries = []
+    for i in range(n):
+        entry = dict(template if i % 2 else resolved)
+        entry["id"] = str(i)
+        entries.append(entry)
+    return entries
+
+
+def timed(f, *args, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        f(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    entries = make_entries(n)
+    assert legacy_get_questions_from_data("Politics", entries) == (
+        get_questions_from_data("Politics", entries)
+    )
+    legacy = timed(legacy_get_questions_from_data, "Politics", entries)
+    single_pass = timed(get_questions_from_data, "Politics", entries)
+    print(f"entries:     {n}")
+    print(f"legacy:      {legacy * 1000:.1f} ms")
+    print(f"single pass: {single_pass * 1000:.1f} ms ({legacy / single_pass:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Compare the question refresh upsert against the previous delete then insert
+path, on a file database holding n questions of which every one moved.
+
+    python -m benchmarks.bench_upsert [n_questions ...]
+"""
+
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from polymarket_predictions_tally.database.benchmark import make_questions
+from polymarket_predictions_tally.database.utils import load_sql_query
+from polymarket_predictions_tally.database.write import question_row, upsert_questions
+from polymarket_predictions_tally.logic import Question
+
+
+def legacy_update_questions(conn: sqlite3.Connection, questions: list[Question]):
+    cursor = conn.cursor()
+    cursor.executemany(
+        load_sql_query("remove_question.sql"),
+        [(question.id,) for question in questions],
+    )
+    cursor.executemany(
+        load_sql_query("insert_question.sql"),
+        [question_row(question) for question in questions],
+    )
+    conn.commit()
+
+
+def run(path: Path, n: int, writer) -> tuple[float, int]:
+    path.unlink(missing_ok=True)
+    conn = sqlite3.connect(path)
+    conn.executescript(load_sql_query("setup.sql"))
+    conn.executemany(
+        load_sql_query("insert_question.sql"),
+        [question_row(question) for question in make_questions(n, 0.5)],
+    )
+    conn.commit()
+    updated = make_questions(n, 0.6)
+
+    changes_before = conn.total_changes
+    start = time.perf_counter()
+    writer(conn, updated)
+    elapsed = time.perf_counter() - start
+    changes = conn.total_changes - changes_before
+    conn.close()
+    return elapsed, changes
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        for n in sizes:
+            print(f"questions: {n}")
+            for name, writer in [
+                ("delete + insert", legacy_update_questions),
+                ("upsert", upsert_questions),
+            ]:
+                elapsed, changes = run(path, n, writer)
+                print(f"  {name:<16} {elapsed * 1000:8.1f} ms  {changes:7} row changes")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,33 +1,66 @@
-from typing import List
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Iterator, List
 from datetime import datetime, timedelta, timezone
-import requests
 import json
+import time
+from polymarket_predictions_tally import cache, client
+from polymarket_predictions_tally.client import GAMMA_API_URL
 from polymarket_predictions_tally.logic import Event, Question
-from polymarket_predictions_tally.constants import MAX_TIME_DELTA_DAYS, MAX_QUESTIONS
+from polymarket_predictions_tally.constants import (
+    HTTP_MAX_CONCURRENCY,
+    ID_CHUNK_SIZE,
+    MAX_TIME_DELTA_DAYS,
+    MAX_QUESTIONS,
+)
 
 
 tag_names = {1: "Sports", 2: "Politics", 3: "Other"}
 tag_ids = {"Sports": 1, "Politics": 2, "Other": 3}
+DEFAULT_TAG = "Politics"
 
 
-def get_questions(tag: str, limit: int = MAX_QUESTIONS) -> List[Question]:
-    endpoint = "https://gamma-api.polymarket.com/markets"
-    data = fetch_data(tag, endpoint, limit)
-    return get_questions_from_data(tag, data)
+def get_questions(
+    tag: str, limit: int = MAX_QUESTIONS, refresh: bool = False
+) -> List[Question]:
+    return asyncio.run(get_questions_async(tag, limit, refresh=refresh))
+
+
+def iter_questions(
+    tag: str, page_size: int = MAX_QUESTIONS, max_items: int | None = None
+) -> Iterator[Question]:
+    """
+    Page through the markets listing with offset pagination, yielding questions
+    as each page arrives so the full result set is never held in memory.
+    """
+    endpoint = f"{GAMMA_API_URL}/markets"
+    offset = 0
+    yielded = 0
+    while max_items is None or yielded < max_items:
+        limit = page_size if max_items is None else min(page_size, max_items - yielded)
+        params = get_listing_params(tag, limit)
+        params["offset"] = offset
+        data = client.get_json(endpoint, params)
+        for question in get_questions_from_data(tag, data):
+            yield question
+            yielded += 1
+            if max_items is not None and yielded >= max_items:
+                return
+        if len(data) < limit:
+            return
+        offset += len(data)
 
 
 def get_events(tag: str, limit: int = 3) -> List[Event]:
-    endpoint = "https://gamma-api.polymarket.com/events"
+    endpoint = f"{GAMMA_API_URL}/events"
     data = fetch_data(tag, endpoint, limit)
     return get_events_from_data(tag, data)
 
 
 def get_question_raw(id: int) -> dict:
-    endpoint = "https://gamma-api.polymarket.com/markets"
+    endpoint = f"{GAMMA_API_URL}/markets"
     params = {"id": id}
-    response = requests.get(endpoint, params=params)
-    response.raise_for_status()
-    return response.json()
+    return client.get_json(endpoint, params)
 
 
 def get_question(id: int, tag: str) -> Question | None:
@@ -36,11 +69,9 @@ def get_question(id: int, tag: str) -> Question | None:
 
 
 def get_event_raw(id: int) -> dict:
-    endpoint = "https://gamma-api.polymarket.com/events"
+    endpoint = f"{GAMMA_API_URL}/events"
     params = {"id": id}
-    response = requests.get(endpoint, params=params)
-    response.raise_for_status()
-    return response.json()
+    return client.get_json(endpoint, params)
 
 
 def get_events_from_data(tag: str, data: List[dict]) -> List[Event]:
@@ -56,35 +87,79 @@ def get_event(id: int, tag: str) -> Event:
 
 
 def get_questions_from_data(tag: str, data: List[dict]) -> List[Question]:
+    now = datetime.now(timezone.utc)
     questions = []
     for entry in data:
         if not entry.get("active"):
             continue
-        question = get_question_from_entry(entry, tag)
+        question = get_question_from_market(parse_market_entry(entry), tag, now)
         if not question:
             continue
         questions.append(question)
     return questions
 
 
-def get_question_from_entry(entry: dict, tag: str) -> Question | None:
+@dataclass
+class MarketEntry:
+    """A raw market entry with its dates and JSON encoded fields decoded once."""
+
+    id: int
+    question: str
+    description: str
+    end_date: datetime | None
+    outcome_prices: list[str] | None
+    outcomes: list[str] | None
+    resolution_status: str | None
+
+
+def parse_market_entry(entry: dict) -> MarketEntry:
     try:
         end_date = datetime.fromisoformat(entry["endDate"].replace("Z", "+00:00"))
     except:
         try:
             end_date = datetime.fromisoformat(entry["endDateIso"])
         except:
-            return None
+            end_date = None
 
-    return Question(
+    try:
+        outcome_prices = json.loads(entry["outcomePrices"])
+        outcomes = json.loads(entry["outcomes"])
+    except (KeyError, json.JSONDecodeError):
+        outcome_prices = None
+        outcomes = None
+
+    return MarketEntry(
         id=int(entry["id"]),
-        question=entry["question"],
-        outcome_probs=[float(p) for p in json.loads(entry["outcomePrices"])],
-        outcomes=json.loads(entry["outcomes"]),
-        tag=tag,
-        outcome=get_resolved_outcome(entry),
+        question=entry.get("question"),
+        description=entry.get("description"),
         end_date=end_date,
-        description=entry["description"],
+        outcome_prices=outcome_prices,
+        outcomes=outcomes,
+        resolution_status=entry.get("umaResolutionStatus"),
+    )
+
+
+def get_question_from_entry(entry: dict, tag: str) -> Question | None:
+    return get_question_from_market(
+        parse_market_entry(entry), tag, datetime.now(timezone.utc)
+    )
+
+
+def get_question_from_market(
+    market: MarketEntry, tag: str, now: datetime
+) -> Question | None:
+    if market.end_date is None or market.outcome_prices is None:
+        return None
+
+    return Question(
+        id=market.id,
+        question=market.question,
+        outcome_probs=[float(p) for p in market.outcome_prices],
+        outcomes=market.outcomes,
+        tag=tag,
+        outcome=get_resolved_outcome_from_market(market, now),
+        end_date=market.end_date,
+        description=market.description,
     )
 
 
@@ -103,12 +178,36 @@ def fetch_data(
     tag: str,
     endpoint: str,
     limit: int,
+    refresh: bool = False,
 ) -> List[dict]:
+    return fetch_listing(tag, endpoint, limit, refresh)[0]
+
+
+def fetch_listing(
+    tag: str,
+    endpoint: str,
+    limit: int,
+    refresh: bool = False,
+) -> tuple[List[dict], float]:
+    """
+    The listing along with the time it was fetched, which is older than now
+    when it is served from the disk cache.
+    """
+    return asyncio.run(fetch_listing_async(tag, endpoint, limit, refresh=refresh))
+
+
+def uses_listing_cache() -> bool:
+    # record and replay have to see every request, and replayed payloads must
+    # never land in the cache a live session reads from
+    return client.get_api_mode() is None
+
+
+def get_listing_params(tag: str, limit: int) -> dict:
     try:
         tag_id = tag_ids[tag]
     except Exception as e:
         raise e
-    params = {
+    return {
         "active": "true",
         "closed": "false",
         "limit": limit,
@@ -121,24 +220,205 @@ def fetch_data(
         ).isoformat(),
     }
 
-    response = requests.get(endpoint, params=params)
-    response.raise_for_status()
-    return response.json()
+
+def get_questions_by_id_list(
+    id_list: list[int],
+    tags: dict[int, str] | None = None,
+    chunk_size: int = ID_CHUNK_SIZE,
+    max_concurrency: int = HTTP_MAX_CONCURRENCY,
+) -> dict[int, Question | None]:
+    return asyncio.run(
+        get_questions_by_id_list_async(id_list, tags, chunk_size, max_concurrency)
+    )
+
+
+def get_questions_for_tags(
+    tags: list[str], limit: int = MAX_QUESTIONS, refresh: bool = False
+) -> tuple[List[Question], float]:
+    return asyncio.run(get_questions_for_tags_async(tags, limit, refresh=refresh))
+
+
+def get_events_for_tags(
+    tags: list[str], limit: int = 3, refresh: bool = False
+) -> List[Event]:
+    return asyncio.run(get_events_for_tags_async(tags, limit, refresh=refresh))
 
 
-def get_questions_by_id_list(id_list: list[int]) -> list[Question | None]:
-    endpoint = "https://gamma-api.polymarket.com/markets"
-    # Create a list of tuples for each id
-    params = [("id", str(id)) for id in id_list]
-    response = requests.get(endpoint, params=params)
-    response.raise_for_status()
-    # Assuming the API returns a dict with the key "markets"
-    return [
-        get_question_from_entry(entry, tag="Politics") for entry in response.json()
-    ]  # .json().get("markets", [])
+# Async versions of the fetch functions. Every request is awaited through a
+# shared semaphore so at most max_concurrency requests are in flight, and the
+# blocking call itself still goes through the pooled client session.
+
+
+async def fetch_json_async(
+    endpoint: str, params: Any, semaphore: asyncio.Semaphore
+) -> Any:
+    async with semaphore:
+        return await asyncio.to_thread(client.get_json, endpoint, params)
+
+
+async def fetch_data_async(
+    tag: str,
+    endpoint: str,
+    limit: int,
+    semaphore: asyncio.Semaphore | None = None,
+    refresh: bool = False,
+) -> List[dict]:
+    listing = await fetch_listing_async(tag, endpoint, limit, semaphore, refresh)
+    return listing[0]
+
+
+async def fetch_listing_async(
+    tag: str,
+    endpoint: str,
+    limit: int,
+    semaphore: asyncio.Semaphore | None = None,
+    refresh: bool = False,
+) -> tuple[List[dict], float]:
+    semaphore = semaphore or asyncio.Semaphore(HTTP_MAX_CONCURRENCY)
+    params = get_listing_params(tag, limit)
+    key = cache.request_key(endpoint, params)
+    use_cache = uses_listing_cache()
+    entry = cache.get_entry(key) if use_cache and not refresh else None
+    if entry is not None:
+        return entry
+    fetched_at = time.time()
+    data = await fetch_json_async(endpoint, params, semaphore)
+    if use_cache:
+        cache.put(key, data)
+    return data, fetched_at
+
+
+async def get_questions_async(
+    tag: str,
+    limit: int = MAX_QUESTIONS,
+    semaphore: asyncio.Semaphore | None = None,
+    refresh: bool = False,
+) -> List[Question]:
+    endpoint = f"{GAMMA_API_URL}/markets"
+    data = await fetch_data_async(tag, endpoint, limit, semaphore, refresh)
+    return get_questions_from_data(tag, data)
+
+
+async def get_questions_listing_async(
+    tag: str,
+    limit: int = MAX_QUESTIONS,
+    semaphore: asyncio.Semaphore | None = None,
+    refresh: bool = False,
+) -> tuple[List[Question], float]:
+    endpoint = f"{GAMMA_API_URL}/markets"
+    data, fetched_at = await fetch_listing_async(
+        tag, endpoint, limit, semaphore, refresh
+    )
+    return get_questions_from_data(tag, data), fetched_at
+
+
+async def get_events_async(
+    tag: str,
+    limit: int = 3,
+    semaphore: asyncio.Semaphore | None = None,
+    refresh: bool = False,
+) -> List[Event]:
+    endpoint = f"{GAMMA_API_URL}/events"
+    data = await fetch_data_async(tag, endpoint, limit, semaphore, refresh)
+    return get_events_from_data(tag, data)
+
+
+async def get_events_for_tags_async(
+    tags: list[str],
+    limit: int = 3,
+    max_concurrency: int = HTTP_MAX_CONCURRENCY,
+    refresh: bool = False,
+) -> List[Event]:
+    semaphore = asyncio.Semaphore(max_concurrency)
+    listings = await asyncio.gather(
+        *(get_events_async(tag, limit, semaphore, refresh) for tag in tags)
+    )
+    events = {}
+    for listing in listings:
+        for event in listing:
+            events.setdefault(event.id, event)
+    return list(events.values())
+
+
+async def get_question_async(
+    id: int, tag: str, semaphore: asyncio.Semaphore | None = None
+) -> Question | None:
+    semaphore = semaphore or asyncio.Semaphore(HTTP_MAX_CONCURRENCY)
+    endpoint = f"{GAMMA_API_URL}/markets"
+    question = await fetch_json_async(endpoint, {"id": id}, semaphore)
+    return get_question_from_entry(question, tag)
+
+
+async def get_event_async(
+    id: int, tag: str, semaphore: asyncio.Semaphore | None = None
+) -> Event:
+    semaphore = semaphore or asyncio.Semaphore(HTTP_MAX_CONCURRENCY)
+    endpoint = f"{GAMMA_API_URL}/events"
+    event = await fetch_json_async(endpoint, {"id": id}, semaphore)
+    return get_event_from_entry(event, tag)
+
+
+async def get_questions_for_tags_async(
+    tags: list[str],
+    limit: int = MAX_QUESTIONS,
+    max_concurrency: int = HTTP_MAX_CONCURRENCY,
+    refresh: bool = False,
+) -> tuple[List[Question], float]:
+    """
+    Fetch the listing of every tag side by side. A market listed under several
+    tags is kept once, with the first of those tags in the given order. Also
+    returns when the oldest of the listings was fetched.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    listings = await asyncio.gather(
+        *(get_questions_listing_async(tag, limit, semaphore, refresh) for tag in tags)
+    )
+    questions = {}
+    for listing, _ in listings:
+        for question in listing:
+            questions.setdefault(question.id, question)
+    fetched_at = min((fetched_at for _, fetched_at in listings), default=time.time())
+    return list(questions.values()), fetched_at
+
+
+async def get_questions_by_id_list_async(
+    id_list: list[int],
+    tags: dict[int, str] | None = None,
+    chunk_size: int = ID_CHUNK_SIZE,
+    max_concurrency: int = HTTP_MAX_CONCURRENCY,
+) -> dict[int, Question | None]:
+    # bounded chunks keep the query string short, and the semaphore keeps the
+    # number of chunks fetched side by side under max_concurrency
+    semaphore = asyncio.Semaphore(max_concurrency)
+    endpoint = f"{GAMMA_API_URL}/markets"
+    chunks = [id_list[i : i + chunk_size] for i in range(0, len(id_list), chunk_size)]
+    results = await asyncio.gather(
+        *(
+            fetch_json_async(endpoint, [("id", str(id)) for id in chunk], semaphore)
+            for chunk in chunks
+        )
+    )
+    now = datetime.now(timezone.utc)
+    questions = {}
+    for data in results:
+        # a single id is answered with the bare market, not a list of one
+        if isinstance(data, dict):
+            data = [data]
+        for entry in data:
+            market = parse_market_entry(entry)
+            # the markets endpoint doesn't echo the tag, keep the one we stored
+            tag = (tags or {}).get(market.id, DEFAULT_TAG)
+            questions[market.id] = get_question_from_market(market, tag, now)
+    return questions
 
 
 def get_resolved_outcome(entry: dict) -> bool | None:
+    return get_resolved_outcome_from_market(
+        parse_market_entry(entry), datetime.now(timezone.utc)
+    )
+
+
+def get_resolved_outcome_from_market(market: MarketEntry, now: datetime) -> bool | None:
     """
     Returns:
         - True: Market resolved to "Yes"
@@ -146,47 +426,36 @@ def get_resolved_outcome(entry: dict) -> bool | None:
         - None: Market not resolved or data format error
     """
 
-    resolved_status = entry.get("umaResolutionStatus")
+    resolved_status = market.resolution_status
 
     if resolved_status is not None and resolved_status != "resolved":
-        print(f"{entry.get('question')} had resolved status not resolved")
+        print(f"{market.question} had resolved status not resolved")
         return None
     # Check if market is resolved
-    try:
-        end_date = datetime.fromisoformat(entry["endDate"].replace("Z", "+00:00"))
-    except:
-        try:
-            end_date = datetime.fromisoformat(entry["endDateIso"])
-        except:
-            end_date = None
-
+    end_date = market.end_date
     if end_date is not None and end_date.tzinfo is None:
         end_date = end_date.replace(tzinfo=timezone.utc)
-    if end_date is not None and end_date > datetime.now(timezone.utc):
-        # print(f"[{end_date}] {entry.get('question')} hasnt reached its end date")
+    if end_date is not None and end_date > now:
+        # print(f"[{end_date}] {market.question} hasnt reached its end date")
         return None
 
-    try:
-        # Parse outcome prices and labels
-        outcome_prices = json.loads(entry["outcomePrices"])
-        outcomes = json.loads(entry["outcomes"])
-
-        # Find the winning outcome index (price == "1")
-        winning_idx = next(
-            (i for i, price in enumerate(outcome_prices) if price == "1"), None
-        )
+    outcome_prices = market.outcome_prices
+    outcomes = market.outcomes
+    if outcome_prices is None or outcomes is None:
+        return None  # Handle missing fields or invalid JSON
 
-        if winning_idx is None or winning_idx >= len(outcomes):
-            print("Reached an unexpected point, useful info for debuging")
-            print(f"[{end_date}] {entry.get('question')} escaped from winning_idx")
-            print(outcome_prices)
-            print(outcomes)
-            print()
+    # Find the winning outcome index (price == "1")
+    winning_idx = next(
+        (i for i, price in enumerate(outcome_prices) if price == "1"), None
+    )
 
-            return None  # No valid winning outcome
+    if winning_idx is None or winning_idx >= len(outcomes):
+        print("Reached an unexpected point, useful info for debuging")
+        print(f"[{end_date}] {market.question} escaped from winning_idx")
+        print(outcome_prices)
+        print(outcomes)
+        print()
 
-        return outcomes[winning_idx] == "Yes"
+        return None  # No valid winning outcome
 
-    except (KeyError, json.JSONDecodeError):
-        print(KeyError, json.JSONDecodeError)
-        return None  # Handle missing fields or invalid JSON
+    return outcomes[winning_idx] == "Yes"
@@ -0,0 +1,87 @@
+from contextlib import closing
+from typing import Any
+import json
+import sqlite3
+import time
+from polymarket_predictions_tally import initialization
+from polymarket_predictions_tally.constants import (
+    CACHE_MAX_ENTRIES,
+    CACHE_TTL_SECONDS,
+)
+
+# the listing window moves with the clock, leaving it out of the key lets
+# repeated sessions share an entry while it is fresh
+VOLATILE_PARAMS = {"end_date_min", "end_date_max"}
+
+
+def request_key(endpoint: str, params: Any) -> str:
+    pairs = params.items() if isinstance(params, dict) else params or []
+    normalized = sorted(
+        (str(key), str(value)) for key, value in pairs if key not in VOLATILE_PARAMS
+    )
+    return json.dumps([endpoint, normalized])
+
+
+def connect() -> sqlite3.Connection:
+    conn = sqlite3.connect(initialization.CACHE_PATH)
+    conn.execute(
+        """CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            payload TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        )"""
+    )
+    return conn
+
+
+def get(key: str, ttl_seconds: float = CACHE_TTL_SECONDS) -> Any | None:
+    entry = get_entry(key, ttl_seconds)
+    return None if entry is None else entry[0]
+
+
+def get_entry(
+    key: str, ttl_seconds: float = CACHE_TTL_SECONDS
+) -> tuple[Any, float] | None:
+    """The cached payload along with the time it was fetched."""
+    if ttl_seconds <= 0:
+        return None
+    now = time.time()
+    with closing(connect()) as conn, conn:
+        row = conn.execute(
+            "SELECT payload, created_at FROM responses "
+            "WHERE key = ? AND created_at > ?",
+            (key, now - ttl_seconds),
+        ).fetchone()
+        if row is None:
+            return None
+        conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+    return json.loads(row[0]), row[1]
+
+
+def put(
+    key: str,
+    payload: Any,
+    ttl_seconds: float = CACHE_TTL_SECONDS,
+    max_entries: int = CACHE_MAX_ENTRIES,
+):
+    if ttl_seconds <= 0:
+        return
+    now = time.time()
+    with closing(connect()) as conn, conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+            (key, json.dumps(payload), now, now),
+        )
+        # evict the least recently used entries over the cap
+        conn.execute(
+            """DELETE FROM responses WHERE key IN (
+                SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+            )""",
+            (max_entries,),
+        )
+
+
+def clear():
+    with closing(connect()) as conn, conn:
+        conn.execute("DELETE FROM responses")
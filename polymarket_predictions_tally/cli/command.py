@@ -3,7 +3,10 @@ from sys import call_tracing
 import click
 from click.utils import echo
 
-from polymarket_predictions_tally import integration
+from polymarket_predictions_tally import client, integration
+from polymarket_predictions_tally.cli import prints
+from polymarket_predictions_tally.constants import DB_PRAGMAS
+from polymarket_predictions_tally.database import benchmark as db_benchmark
 from polymarket_predictions_tally.integration import (
     show_users,
     update_database,
@@ -18,10 +21,11 @@ def cli(ctx: click.Context):
 
 @cli.command()  # of group cli
 @click.argument("username")
+@click.option("--refresh", is_flag=True, help="Bypass the cached market list")
 @click.pass_context
-def predict(ctx, username):
+def predict(ctx, username, refresh):
     conn = ctx.obj["conn"]
-    integration.predict(username, conn)
+    integration.predict(username, conn, refresh=refresh)
 
 
 @cli.command()  # of group cli
@@ -30,6 +34,7 @@ def update(ctx):
     echo("Updating database")
     conn = ctx.obj["conn"]
     update_database(conn)
+    prints.api_stats(client.stats)
 
 
 @cli.command()  # of group cli
@@ -49,10 +54,11 @@ def users(ctx):
 
 @cli.command()  # of group cli
 @click.argument("username")
+@click.option("--refresh", is_flag=True, help="Bypass the cached market list")
 @click.pass_context
-def bet(ctx, username):
+def bet(ctx, username, refresh):
     conn = ctx.obj["conn"]
-    integration.bet(username, conn)
+    integration.bet(username, conn, refresh=refresh)
 
 
 @cli.command()  # of group cli
@@ -61,3 +67,24 @@ def bet(ctx, username):
 def sell(ctx, username):
     conn = ctx.obj["conn"]
     integration.sell(username, conn)
+
+
+@cli.command()  # of group cli
+@click.option("--limit", default=20, show_default=True, help="Events per tag")
+@click.option("--refresh", is_flag=True, help="Bypass the cached event list")
+@click.pass_context
+def events(ctx, limit, refresh):
+    conn = ctx.obj["conn"]
+    integration.ingest_events(conn, limit, refresh=refresh)
+
+
+@cli.command()  # of group cli
+@click.option("--questions", default=500, show_default=True, help="Rows per step")
+def benchmark(questions):
+    profiles = {
+        "sqlite defaults": db_benchmark.SQLITE_DEFAULTS,
+        "wal": db_benchmark.WAL,
+        "config": DB_PRAGMAS,
+    }
+    results = db_benchmark.compare_profiles(profiles, questions)
+    prints.benchmark_results(results)
@@ -1,5 +1,6 @@
 from types import new_class
 from click.utils import echo
+from polymarket_predictions_tally.client import ClientStats
 from polymarket_predictions_tally.logic import Position, Question, Response, User
 import click
 
@@ -151,6 +152,34 @@ def users(users_list: list[User]):
         click.echo(f"{user.username}")
 
 
+def questions_refreshed(question_count: int, skipped_count: int):
+    click.echo(
+        f"Refreshed {question_count} questions, "
+        f"{skipped_count} unchanged and left as they were"
+    )
+
+
+def events_ingested(event_count: int, question_count: int):
+    click.echo(f"Stored {event_count} events, {question_count} new markets")
+
+
+def api_stats(stats: ClientStats):
+    if stats.retries == 0 and stats.throttle_waits == 0:
+        return
+    click.echo(
+        f"API: {stats.requests} requests, {stats.retries} retries, "
+        f"{stats.throttle_waits} throttle waits ({stats.throttle_wait_seconds:.1f}s)"
+    )
+
+
+def benchmark_results(results: dict[str, dict[str, float]]):
+    steps = list(next(iter(results.values())))
+    click.echo(f"{'profile':<16}" + "".join(f"{step:>18}" for step in steps))
+    for profile, timings in results.items():
+        cells = "".join(f"{timings[step] * 1000:>15.1f} ms" for step in steps)
+        click.echo(f"{profile:<16}{cells}")
+
+
 def draw_bar(prob_yes, bar_length=20):
     percent_yes = int(prob_yes * 100)
     percent_no = 100 - percent_yes
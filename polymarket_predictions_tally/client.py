@@ -0,0 +1,205 @@
+from dataclasses import dataclass
+from typing import Any
+import hashlib
+import json
+import os
+import pathlib
+import random
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from polymarket_predictions_tally import initialization
+from polymarket_predictions_tally.cache import request_key
+from polymarket_predictions_tally.constants import (
+    HTTP_BACKOFF_BASE_SECONDS,
+    HTTP_BACKOFF_MAX_SECONDS,
+    HTTP_MAX_RETRIES,
+    HTTP_POOL_SIZE,
+    HTTP_RATE_LIMIT_BURST,
+    HTTP_RATE_LIMIT_PER_SECOND,
+    HTTP_TIMEOUT_SECONDS,
+)
+
+GAMMA_API_URL = "https://gamma-api.polymarket.com"
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# POLYTALLY_API_MODE=record saves every gamma-api response to the fixture store,
+# POLYTALLY_API_MODE=replay serves them back without touching the network
+API_MODE_VAR = "POLYTALLY_API_MODE"
+FIXTURES_DIR_VAR = "POLYTALLY_FIXTURES_DIR"
+REPLAY_LATENCY_VAR = "POLYTALLY_REPLAY_LATENCY_MS"
+
+
+class MissingFixture(Exception):
+    pass
+
+
+@dataclass
+class ClientStats:
+    requests: int = 0
+    retries: int = 0
+    throttle_waits: int = 0
+    throttle_wait_seconds: float = 0.0
+
+
+class TokenBucket:
+    """
+    Thread safe token bucket. A caller that finds the bucket empty reserves the
+    next token anyway and sleeps until it would have been refilled, so waiting
+    callers are served in order without spinning.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> float:
+        if self.rate <= 0:
+            return 0.0
+        with self.lock:
+            now = time.monotonic()
+            elapsed = now - self.updated_at
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+stats = ClientStats()
+_stats_lock = threading.Lock()
+rate_limiter = TokenBucket(HTTP_RATE_LIMIT_PER_SECOND, HTTP_RATE_LIMIT_BURST)
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def make_session(pool_size: int = HTTP_POOL_SIZE) -> requests.Session:
+    session = requests.Session()
+    # one adapter for every gamma-api host so sockets are reused between calls
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(
+        {
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        }
+    )
+    return session
+
+
+def get_session() -> requests.Session:
+    global _session
+    # the async fetchers call this from many worker threads at once, only one
+    # of them may build the session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = make_session()
+    return _session
+
+
+def close_session():
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def get_api_mode() -> str | None:
+    return os.environ.get(API_MODE_VAR)
+
+
+def get_json(endpoint: str, params: Any = None) -> Any:
+    mode = get_api_mode()
+    if mode == "replay":
+        return replay(endpoint, params)
+    response = send_with_retries(endpoint, params)
+    response.raise_for_status()
+    data = response.json()
+    if mode == "record":
+        record(endpoint, params, data)
+    return data
+
+
+def send_with_retries(
+    endpoint: str, params: Any, max_retries: int = HTTP_MAX_RETRIES
+) -> requests.Response:
+    attempt = 0
+    while True:
+        throttle_wait = rate_limiter.acquire()
+        with _stats_lock:
+            stats.requests += 1
+            if throttle_wait > 0:
+                stats.throttle_waits += 1
+                stats.throttle_wait_seconds += throttle_wait
+        try:
+            response = get_session().get(
+                endpoint, params=params, timeout=HTTP_TIMEOUT_SECONDS
+            )
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt >= max_retries:
+                raise
+            response = None
+        else:
+            if response.status_code not in RETRY_STATUS_CODES or attempt >= max_retries:
+                return response
+        time.sleep(get_backoff_delay(attempt, response))
+        attempt += 1
+        with _stats_lock:
+            stats.retries += 1
+
+
+def get_backoff_delay(attempt: int, response: requests.Response | None) -> float:
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None and retry_after.isdigit():
+            return min(float(retry_after), HTTP_BACKOFF_MAX_SECONDS)
+    # equal jitter: keep half of the exponential step and randomize the rest
+    step = min(HTTP_BACKOFF_MAX_SECONDS, HTTP_BACKOFF_BASE_SECONDS * 2**attempt)
+    return step / 2 + random.uniform(0, step / 2)
+
+
+def reset_stats():
+    global stats
+    with _stats_lock:
+        stats = ClientStats()
+
+
+def get_fixtures_dir() -> pathlib.Path:
+    default = initialization.data_dir / "fixtures"
+    return pathlib.Path(os.environ.get(FIXTURES_DIR_VAR, default))
+
+
+def get_fixture_path(endpoint: str, params: Any) -> pathlib.Path:
+    key = request_key(endpoint, params)
+    name = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+    return get_fixtures_dir() / f"{name}.json"
+
+
+def record(endpoint: str, params: Any, data: Any):
+    path = get_fixture_path(endpoint, params)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fixture = {"request": request_key(endpoint, params), "response": data}
+    path.write_text(json.dumps(fixture), encoding="utf-8")
+
+
+def replay(endpoint: str, params: Any) -> Any:
+    path = get_fixture_path(endpoint, params)
+    if not path.exists():
+        raise MissingFixture(
+            f"No recorded response for {request_key(endpoint, params)} in {path.parent}"
+        )
+    latency_ms = float(os.environ.get(REPLAY_LATENCY_VAR, 0))
+    if latency_ms > 0:
+        time.sleep(latency_ms / 1000)
+    return json.loads(path.read_text(encoding="utf-8"))["response"]
@@ -7,3 +7,34 @@ from polymarket_predictions_tally.initialization import initialize_config_if_nee
 _config = initialize_config_if_needed()
 MAX_TIME_DELTA_DAYS = _config["settings"]["max_time_delta_days"]
 MAX_QUESTIONS = _config["settings"]["max_questions"]
+TAGS = _config["settings"].get("tags", ["Politics"])
+
+# sections added after the first release may be missing from older user configs
+_http = _config.get("http", {})
+HTTP_POOL_SIZE = _http.get("pool_size", 10)
+HTTP_TIMEOUT_SECONDS = _http.get("timeout_seconds", 10)
+HTTP_MAX_CONCURRENCY = _http.get("max_concurrency", 8)
+ID_CHUNK_SIZE = _http.get("id_chunk_size", 50)
+HTTP_RATE_LIMIT_PER_SECOND = _http.get("rate_limit_per_second", 20)
+HTTP_RATE_LIMIT_BURST = _http.get("rate_limit_burst", 20)
+HTTP_MAX_RETRIES = _http.get("max_retries", 5)
+HTTP_BACKOFF_BASE_SECONDS = _http.get("backoff_base_seconds", 0.5)
+HTTP_BACKOFF_MAX_SECONDS = _http.get("backoff_max_seconds", 30)
+
+_cache = _config.get("cache", {})
+CACHE_TTL_SECONDS = _cache.get("ttl_seconds", 300)
+CACHE_MAX_ENTRIES = _cache.get("max_entries", 100)
+
+_history = _config.get("history", {})
+PRICE_HISTORY_RETENTION_DAYS = _history.get("retention_days", 365)
+
+_database = _config.get("database", {})
+DB_CACHED_STATEMENTS = _database.get("cached_statements", 256)
+DB_PRAGMAS = {
+    "journal_mode": _database.get("journal_mode", "wal"),
+    "synchronous": _database.get("synchronous", "normal"),
+    "mmap_size": _database.get("mmap_size", 268435456),
+    "cache_size": _database.get("cache_size", -16000),
+    "temp_store": _database.get("temp_store", "memory"),
+    "busy_timeout": _database.get("busy_timeout", 5000),
+}
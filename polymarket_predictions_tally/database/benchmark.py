@@ -0,0 +1,102 @@
+import pathlib
+import sqlite3
+import tempfile
+import time
+from datetime import datetime
+from polymarket_predictions_tally.database.read import (
+    get_latest_responses_to_questions,
+    get_questions_from_ids,
+)
+from polymarket_predictions_tally.database.utils import load_sql_query, unit_of_work
+from polymarket_predictions_tally.database.write import (
+    insert_question,
+    insert_response,
+    insert_user_by_name,
+    record_price_snapshots,
+    update_questions,
+)
+from polymarket_predictions_tally.initialization import connect_db
+from polymarket_predictions_tally.logic import Question, Response
+
+# what sqlite does when nothing is configured, the baseline for the others
+SQLITE_DEFAULTS = {
+    "journal_mode": "delete",
+    "synchronous": "full",
+    "mmap_size": 0,
+    "cache_size": -2000,
+    "temp_store": "default",
+    "busy_timeout": 0,
+}
+WAL = {**SQLITE_DEFAULTS, "journal_mode": "wal", "synchronous": "normal"}
+
+
+def make_questions(
+    count: int, yes_price: float, outcome: bool | None = None
+) -> list[Question]:
+    return [
+        Question(
+            id=id,
+            question=f"Question {id}?",
+            outcome_probs=[yes_price, round(1 - yes_price, 4)],
+            outcomes=["Yes", "No"],
+            tag="Politics",
+            outcome=outcome,
+            end_date=datetime(2025, 1, 1),
+            description="Benchmark question",
+        )
+        for id in range(count)
+    ]
+
+
+def run_workload(conn: sqlite3.Connection, question_count: int) -> dict[str, float]:
+    """
+    Time the write and read patterns of a session: questions and responses
+    stored one commit at a time as predict does, then a refresh in a single
+    unit of work as update does, then the lookups update reads back.
+    """
+    conn.executescript(load_sql_query("setup.sql"))
+    questions = make_questions(question_count, 0.5)
+    timings = {}
+
+    start = time.perf_counter()
+    for question in questions:
+        insert_question(conn, question)
+    timings["insert questions"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    insert_user_by_name(conn, "benchmark")
+    now = datetime.now()
+    for question in questions:
+        response = Response(1, question.id, "Yes", now, None, None)
+        insert_response(conn, response)
+    timings["insert responses"] = time.perf_counter() - start
+
+    moved = make_questions(question_count, 0.6)
+    start = time.perf_counter()
+    with unit_of_work(conn):
+        update_questions(conn, moved)
+        record_price_snapshots(conn, moved)
+    timings["refresh"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    get_questions_from_ids(conn, [question.id for question in questions])
+    get_latest_responses_to_questions(conn, moved)
+    timings["read"] = time.perf_counter() - start
+    return timings
+
+
+def compare_profiles(
+    profiles: dict[str, dict], question_count: int
+) -> dict[str, dict[str, float]]:
+    # every profile gets a fresh database file in the same directory, so
+    # they share the disk and only the settings differ
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, pragmas in profiles.items():
+            path = pathlib.Path(tmp) / f"{len(results)}.db"
+            conn = connect_db(path, pragmas=pragmas)
+            try:
+                results[name] = run_workload(conn, question_count)
+            finally:
+                conn.close()
+    return results
@@ -1,6 +1,17 @@
+import json
 import sqlite3
-from polymarket_predictions_tally.database.utils import load_sql_query, newest_response
-from polymarket_predictions_tally.logic import Position, Question, Response, User
+from datetime import datetime, timezone
+from polymarket_predictions_tally.database.utils import (
+    from_fixed_price,
+    load_sql_query,
+)
+from polymarket_predictions_tally.logic import (
+    Position,
+    PriceSnapshot,
+    Question,
+    Response,
+    User,
+)
 
 
 def get_user(conn: sqlite3.Connection, username: str) -> User | None:
@@ -29,6 +40,15 @@ def get_user_from_id(conn: sqlite3.Connection, user_id: int) -> User | None:
         return User(*results)
 
 
+def get_users_from_ids(
+    conn: sqlite3.Connection, user_ids: list[int]
+) -> dict[int, User]:
+    cursor = conn.cursor()
+    query = load_sql_query("get_users_from_ids.sql")
+    cursor.execute(query, (json.dumps(user_ids),))
+    return {result[0]: User(*result) for result in cursor.fetchall()}
+
+
 def has_user_answered(
     conn: sqlite3.Connection, user_id: int, question_id: int
 ) -> Response | None:
@@ -45,11 +65,12 @@ def get_previous_user_responses(
     api_questions: list[Question],
     user_id: int,
 ) -> list[Response | None]:
-    previous_user_responses = []
-    for question in api_questions:
-        response = has_user_answered(conn, user_id, question.id)
-        previous_user_responses.append(response)
-    return previous_user_responses
+    cursor = conn.cursor()
+    query = load_sql_query("get_latest_user_responses.sql")
+    question_ids = [question.id for question in api_questions]
+    cursor.execute(query, (user_id, json.dumps(question_ids)))
+    responses = {result[1]: Response(*result) for result in cursor.fetchall()}
+    return [responses.get(question_id) for question_id in question_ids]
 
 
 def is_question_in_db(conn: sqlite3.Connection, question_id) -> bool:
@@ -60,12 +81,23 @@ def is_question_in_db(conn: sqlite3.Connection, question_id) -> bool:
     return bool(results[0])
 
 
+def get_question_hashes(
+    conn: sqlite3.Connection, question_ids: list[int]
+) -> dict[int, str | None]:
+    query = load_sql_query("get_question_hashes.sql")
+    cursor = conn.cursor()
+    cursor.execute(query, (json.dumps(question_ids),))
+    return {question_id: content_hash for question_id, content_hash in cursor}
+
+
 def validate_response(
     conn: sqlite3.Connection, response: Response
 ) -> tuple[bool, bool]:
-    user_ids = get_user_ids(conn)
-    questions_ids = get_question_ids(conn)
-    return (response.user_id in user_ids, response.question_id in questions_ids)
+    query = load_sql_query("validate_response.sql")
+    cursor = conn.cursor()
+    cursor.execute(query, (response.user_id, response.question_id))
+    user_exists, question_exists = cursor.fetchone()
+    return (bool(user_exists), bool(question_exists))
 
 
 def get_user_ids(conn: sqlite3.Connection) -> list[int]:
@@ -96,9 +128,9 @@ def get_all_responses_to_questions(
     conn: sqlite3.Connection, questions: list[Question]
 ) -> list[list[Response]]:
     cursor = conn.cursor()
+    query = load_sql_query("get_responses_to_question.sql")
     responses = []
     for question in questions:
-        query = load_sql_query("get_responses_to_question.sql")
         cursor.execute(query, (question.id,))
         results = cursor.fetchall()
         responses_to_question = [
@@ -113,25 +145,15 @@ def get_latest_responses_to_questions(
     conn: sqlite3.Connection, questions: list[Question]
 ) -> list[dict[int, Response]]:
     cursor = conn.cursor()
-    responses = []
-    for question in questions:
-        query = load_sql_query("get_responses_to_question.sql")
-        cursor.execute(query, (question.id,))
-        results = cursor.fetchall()
-        responses_to_question = [
-            Response.from_database_entry(result) for result in results
-        ]
-        responses_to_question_dict = {}
-        for response in responses_to_question:
-            responses_to_question_dict.setdefault(response.user_id, []).append(response)
-        latest_responses_to_question = {
-            user_id: newest_response(responses_to_question_by_user)
-            for user_id, responses_to_question_by_user in responses_to_question_dict.items()
-        }
-
-        responses.append(latest_responses_to_question)
-
-    return responses
+    query = load_sql_query("get_latest_responses_to_questions.sql")
+    cursor.execute(query, (json.dumps([question.id for question in questions]),))
+    responses_by_question = {}
+    for result in cursor.fetchall():
+        response = Response.from_database_entry(result)
+        responses_by_question.setdefault(response.question_id, {})[
+            response.user_id
+        ] = response
+    return [responses_by_question.get(question.id, {}) for question in questions]
 
 
 def get_users_affected_by_update(
@@ -139,11 +161,17 @@ def get_users_affected_by_update(
     latest_responses: list[dict[int, Response]],
     updated_questions: list[Question],
 ) -> dict[User, list[tuple[Response, bool]]]:
+    user_ids = {
+        user_id
+        for responses_to_question in latest_responses
+        for user_id in responses_to_question
+    }
+    users = get_users_from_ids(conn, list(user_ids))
     info = []
     info_dict = {}
     for responses_to_question, question in zip(latest_responses, updated_questions):
         for user_id, latest_response in responses_to_question.items():
-            user = get_user_from_id(conn, user_id)
+            user = users.get(user_id)
             user_answer = latest_response.answer
             assert not question.outcome is None
             if question.outcome == True:
@@ -177,13 +205,10 @@ def get_all_responses(conn: sqlite3.Connection, user_id: int) -> list[Response]:
 
 
 def get_latest_responses(conn: sqlite3.Connection, user_id: int) -> list[Response]:
-    all_responses = get_all_responses(conn, user_id)
-    responses_dict = {}
-    for response in all_responses:
-        responses_dict.setdefault(response.question_id, []).append(response)
-    return [
-        newest_response(responses) for question_id, responses in responses_dict.items()
-    ]
+    cursor = conn.cursor()
+    query = load_sql_query("get_latest_responses.sql")
+    cursor.execute(query, (user_id,))
+    return [Response.from_database_entry(result) for result in cursor.fetchall()]
 
 
 def get_responses(
@@ -203,12 +228,20 @@ def get_question_from_id(conn: sqlite3.Connection, question_id: int) -> Question
     return Question.from_database_entry(results)
 
 
-def get_questions_from_ids(conn: sqlite3.Connection, ids: list[int]) -> list[Question]:
-    questions = []
-    for question_id in ids:
-        questions.append(get_question_from_id(conn, question_id))
-
-    return questions
+def get_questions_from_ids(
+    conn: sqlite3.Connection, ids: list[int]
+) -> list[Question | None]:
+    # the ids go in as one JSON array, so there is no bound on how many are
+    # requested and the whole batch is a single statement. Ids that are not
+    # stored come back as None, like get_question_from_id
+    cursor = conn.cursor()
+    query = load_sql_query("get_questions_from_ids.sql")
+    cursor.execute(query, (json.dumps(ids),))
+    questions_by_id = {}
+    for result in cursor.fetchall():
+        question = Question.from_database_entry(result)
+        questions_by_id[question.id] = question
+    return [questions_by_id.get(question_id) for question_id in ids]
 
 
 def get_stats(conn: sqlite3.Connection, user_id: int) -> tuple[int, int]:
@@ -223,11 +256,12 @@ def get_user_positions(
     api_questions: list[Question],
     user_id: int,
 ) -> list[Position | None]:
-    previous_user_responses = []
-    for question in api_questions:
-        response = get_user_position(conn, user_id, question.id)
-        previous_user_responses.append(response)
-    return previous_user_responses
+    cursor = conn.cursor()
+    query = load_sql_query("get_user_positions_on_questions.sql")
+    question_ids = [question.id for question in api_questions]
+    cursor.execute(query, (user_id, json.dumps(question_ids)))
+    positions = {result[1]: Position(*result) for result in cursor.fetchall()}
+    return [positions.get(question_id) for question_id in question_ids]
 
 
 def get_user_position(
@@ -280,8 +314,40 @@ def get_all_user_positions(conn: sqlite3.Connection, user_id: int) -> list[Posit
 def get_questions_from_positions(
     conn: sqlite3.Connection, positions: list[Position]
 ) -> list[Question]:
-    questions = [
-        get_question_from_id(conn, position.question_id) for position in positions
-    ]
+    questions = get_questions_from_ids(
+        conn, [position.question_id for position in positions]
+    )
     assert all(question is not None for question in questions)
     return questions
+
+
+def get_latest_prices(
+    conn: sqlite3.Connection, question_ids: list[int]
+) -> dict[int, tuple[int, int]]:
+    # fixed point prices of the newest snapshot of each question
+    cursor = conn.cursor()
+    query = load_sql_query("get_latest_price_snapshots.sql")
+    cursor.execute(query, (json.dumps(question_ids),))
+    return {question_id: (yes, no) for question_id, yes, no in cursor}
+
+
+def get_price_history(
+    conn: sqlite3.Connection,
+    question_id: int,
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> list[PriceSnapshot]:
+    start_epoch = int(start.timestamp()) if start else 0
+    end_epoch = int(end.timestamp()) if end else 2**63 - 1
+    cursor = conn.cursor()
+    query = load_sql_query("get_price_history.sql")
+    cursor.execute(query, (question_id, start_epoch, end_epoch))
+    return [
+        PriceSnapshot(
+            question_id=question_id,
+            timestamp=datetime.fromtimestamp(timestamp, tz=timezone.utc),
+            yes_price=from_fixed_price(yes),
+            no_price=from_fixed_price(no),
+        )
+        for question_id, timestamp, yes, no in cursor.fetchall()
+    ]
@@ -1,13 +1,74 @@
 from click.decorators import T
-from polymarket_predictions_tally.logic import Position, Response, Transaction
+from polymarket_predictions_tally.logic import Position, Question, Response, Transaction
 from importlib.resources import files
+from contextlib import contextmanager
+from functools import cache
+import hashlib
+import json
+import sqlite3
+
+# nesting depth of the open unit of work of each connection
+_units_of_work: dict[sqlite3.Connection, int] = {}
+
+
+@contextmanager
+def unit_of_work(conn: sqlite3.Connection):
+    """
+    Run the writes inside the block as one transaction. Writers call commit()
+    instead of conn.commit(), which does nothing while a unit of work is open,
+    so the block commits once when it exits, or rolls back if it raises.
+    Nested units join the outermost one.
+    """
+    depth = _units_of_work.get(conn, 0)
+    _units_of_work[conn] = depth + 1
+    try:
+        yield conn
+    except BaseException:
+        if depth == 0:
+            conn.rollback()
+        raise
+    else:
+        if depth == 0:
+            conn.commit()
+    finally:
+        if depth == 0:
+            del _units_of_work[conn]
+        else:
+            _units_of_work[conn] = depth
+
+
+def commit(conn: sqlite3.Connection):
+    if conn not in _units_of_work:
+        conn.commit()
 
 
 def newest_response(responses: list[Response]) -> Response:
     return max(responses, key=lambda response: response.timestamp)
 
 
+# prices are stored as integers in units of 1/PRICE_SCALE
+PRICE_SCALE = 10_000
+
+
+def to_fixed_price(price: float) -> int:
+    return round(price * PRICE_SCALE)
+
+
+def from_fixed_price(price: int) -> float:
+    return price / PRICE_SCALE
+
+
+def question_content_hash(question: Question) -> str:
+    # only the fields a refresh can move, so an unchanged market hashes the same
+    fields = [question.outcome_probs, question.outcome, question.end_date.isoformat()]
+    return hashlib.sha1(json.dumps(fields).encode("utf-8")).hexdigest()
+
+
+@cache
 def load_sql_query(filename: str) -> str:
+    # Each query file is read once and the same string is handed out after
+    # that, which also lets sqlite3's per connection statement cache (keyed
+    # by the SQL text) reuse the prepared statement on repeated executes.
     path = files("polymarket_predictions_tally.queries").joinpath(filename)
     return path.read_text(encoding="utf-8")
 
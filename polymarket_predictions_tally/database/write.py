@@ -1,17 +1,27 @@
 import json
 from os import listdir
 import sqlite3
+import time
 from sqlite3.dbapi2 import Connection
 
 from polymarket_predictions_tally.database.read import (
+    get_latest_prices,
     get_positions_on_question,
+    get_question_hashes,
     get_user,
     get_user_id_by_name,
-    is_question_in_db,
     validate_response,
 )
-from polymarket_predictions_tally.database.utils import get_new_position, load_sql_query
+from polymarket_predictions_tally.database.utils import (
+    commit,
+    get_new_position,
+    load_sql_query,
+    question_content_hash,
+    to_fixed_price,
+    unit_of_work,
+)
 from polymarket_predictions_tally.logic import (
+    Event,
     InvalidResponse,
     Position,
     Question,
@@ -39,24 +49,24 @@ def insert_user_by_name(conn: sqlite3.Connection, username: str):
     query = load_sql_query("insert_user_by_name.sql")
     cursor.execute(query, (username,))
     user_id = get_user_id_by_name(conn, username)
-    conn.commit()
+    commit(conn)
     assert not user_id is None
     insert_default_stats(conn, user_id=user_id)
-    conn.commit()
+    commit(conn)
 
 
 def remove_user(conn: sqlite3.Connection, id: int):
     cursor = conn.cursor()
     insert_user_query = load_sql_query("remove_user.sql")
     cursor.execute(insert_user_query, (id,))
-    conn.commit()
+    commit(conn)
 
 
 def update_user(conn: sqlite3.Connection, id: int, new_budget: int):
     cursor = conn.cursor()
     update_user_query = load_sql_query("update_user.sql")
     cursor.execute(update_user_query, (new_budget, id))
-    conn.commit()
+    commit(conn)
 
 
 def insert_user(conn: sqlite3.Connection, user: User):
@@ -64,7 +74,7 @@ def insert_user(conn: sqlite3.Connection, user: User):
     insert_user_query = load_sql_query("insert_user.sql")
     cursor.execute(insert_user_query, (user.id, user.username, user.budget))
     insert_default_stats(conn, user_id=user.id)
-    conn.commit()
+    commit(conn)
 
 
 def insert_response(conn: sqlite3.Connection, response: Response):
@@ -81,7 +91,7 @@ def insert_response(conn: sqlite3.Connection, response: Response):
         case (True, True):
             cursor = conn.cursor()
             cursor.execute(insert_response_query, params)
-            conn.commit()
+            commit(conn)
         case (False, True):
             raise InvalidResponse(
                 f"Invalid Response: Invalid user_id: {response.user_id}"
@@ -97,77 +107,149 @@ def insert_response(conn: sqlite3.Connection, response: Response):
 
 
 def update_question(conn: sqlite3.Connection, question: Question):
-    remove_question(conn, question.id)
-    insert_question(conn, question)
-
-
-def update_questions(conn: sqlite3.Connection, questions: list[Question | None]):
-    for question in questions:
-        if question:
-            update_question(conn, question)
-
-
-def update_present_questions(conn: sqlite3.Connection, api_questions: list[Question]):
-    for question in api_questions:
-        if is_question_in_db(conn, question.id):
-            update_question(conn, question)
+    upsert_questions(conn, [question])
+
+
+def update_questions(conn: sqlite3.Connection, questions: list[Question | None]) -> int:
+    """Rewrite the questions whose content changed, returns how many were skipped."""
+    questions = [question for question in questions if question]
+    stored_hashes = get_question_hashes(conn, [question.id for question in questions])
+    changed = [
+        question
+        for question in questions
+        if stored_hashes.get(question.id) != question_content_hash(question)
+    ]
+    upsert_questions(conn, changed)
+    return len(questions) - len(changed)
+
+
+def update_present_questions(
+    conn: sqlite3.Connection, api_questions: list[Question]
+) -> int:
+    """
+    Refresh the api questions that are already stored, leaving the rest out.
+    Returns how many stored questions were skipped because nothing changed.
+    """
+    # only stored ids come back, so this doubles as the presence check
+    stored_hashes = get_question_hashes(
+        conn, [question.id for question in api_questions]
+    )
+    present = [question for question in api_questions if question.id in stored_hashes]
+    changed = [
+        question
+        for question in present
+        if stored_hashes[question.id] != question_content_hash(question)
+    ]
+    upsert_questions(conn, changed)
+    return len(present) - len(changed)
+
+
+def upsert_questions(conn: sqlite3.Connection, questions: list[Question]):
+    """
+    Insert the questions, or update the prices, outcome and end date of the
+    ones already stored, in place so rows pointing at them stay valid.
+    """
+    if not questions:
+        return
+    cursor = conn.cursor()
+    cursor.executemany(
+        load_sql_query("upsert_question.sql"),
+        [question_row(question) for question in questions],
+    )
+    commit(conn)
 
 
 def remove_question(conn: sqlite3.Connection, id: int):
     remove_question_query = load_sql_query("remove_question.sql")
     cursor = conn.cursor()
     cursor.execute(remove_question_query, (id,))
-    conn.commit()
+    commit(conn)
 
 
 def insert_question(conn: sqlite3.Connection, question: Question):
+    insert_question_query = load_sql_query("insert_question.sql")
+    cursor = conn.cursor()
+    cursor.execute(insert_question_query, question_row(question))
+
+    # Commit the transaction
+    commit(conn)
+
+
+def question_row(question: Question) -> tuple:
     # Convert lists to JSON strings
     outcome_probs_json = json.dumps(question.outcome_probs)
     outcomes_json = json.dumps(question.outcomes)
-
-    insert_question_query = load_sql_query("insert_question.sql")
-    cursor = conn.cursor()
-    cursor.execute(
-        insert_question_query,
-        (
-            question.id,
-            question.question,
-            question.tag,
-            question.end_date,
-            question.description,
-            question.outcome,
-            outcome_probs_json,
-            outcomes_json,
-        ),
+    return (
+        question.id,
+        question.question,
+        question.tag,
+        question.end_date,
+        question.description,
+        question.outcome,
+        outcome_probs_json,
+        outcomes_json,
+        question_content_hash(question),
     )
 
-    # Commit the transaction
-    conn.commit()
+
+def insert_events(conn: sqlite3.Connection, events: list[Event]) -> int:
+    """
+    Store events, their markets and the links between them in a single
+    transaction. A market listed by several events is only written once.
+    Returns the number of markets that were not stored before.
+    """
+    event_rows = []
+    questions = []
+    link_rows = []
+    seen_events = set()
+    seen_questions = set()
+    for event in events:
+        if event.id in seen_events:
+            continue
+        seen_events.add(event.id)
+        event_rows.append((event.id, event.title, event.end_date))
+        for question in event.questions:
+            link_rows.append((event.id, question.id))
+            if question.id in seen_questions:
+                continue
+            seen_questions.add(question.id)
+            questions.append(question)
+
+    with unit_of_work(conn):
+        cursor = conn.cursor()
+        cursor.executemany(load_sql_query("upsert_event.sql"), event_rows)
+        # markets already stored are left alone, so count only real inserts
+        changes_before = conn.total_changes
+        cursor.executemany(
+            load_sql_query("insert_question.sql"),
+            [question_row(question) for question in questions],
+        )
+        new_questions = conn.total_changes - changes_before
+        cursor.executemany(load_sql_query("insert_event_question.sql"), link_rows)
+        record_price_snapshots(conn, questions)
+    return new_questions
 
 
 def update_responses(
     conn: sqlite3.Connection, responses: list[list[Response]], questions: list[Question]
 ):
-    cursor = conn.cursor()
-    query = load_sql_query("update_response.sql")
-
+    rows = []
     for question, responses_to_question in zip(questions, responses):
         if not question.outcome:
             continue
 
+        if question.outcome == True:
+            correct_answer = "Yes"
+        else:
+            correct_answer = "No"
+
         for response in responses_to_question:
             assert response.answer in ("Yes", "No")
-            assert not question.outcome is None
-
-            if question.outcome == True:
-                correct_answer = "Yes"
-            else:
-                correct_answer = "No"
-
             correct = response.answer == correct_answer
-            cursor.execute(
-                query, (correct, question.id, response.user_id, response.timestamp)
-            )
+            rows.append((correct, question.id, response.user_id, response.timestamp))
+
+    cursor = conn.cursor()
+    cursor.executemany(load_sql_query("update_response.sql"), rows)
 
 
 def insert_default_stats(conn: sqlite3.Connection, user_id: int):
@@ -190,10 +272,13 @@ def update_user_stats(
 def update_users_stats(
     conn: sqlite3.Connection, update_info: dict[User, list[tuple[Response, bool]]]
 ):
+    rows = []
     for user, info in update_info.items():
         right_count = sum([correct for _, correct in info])
         wrong_count = len(info) - right_count
-        update_user_stats(conn, user.id, right_count, wrong_count)
+        rows.append((right_count, wrong_count, user.id))
+    cursor = conn.cursor()
+    cursor.executemany(load_sql_query("update_user_stats.sql"), rows)
 
 
 def perform_transaction(
@@ -214,10 +299,11 @@ def perform_transaction(
     assert position.user_id == transaction.user_id
     prices = question.outcome_probs
     price = prices[0] if transaction.answer else prices[1]
-    insert_transaction(conn, transaction)
     new_position, budget_delta = get_new_position(position, transaction, price)
-    update_position(conn, new_position)
-    update_user_budget(conn, position.user_id, budget_delta)
+    with unit_of_work(conn):
+        insert_transaction(conn, transaction)
+        update_position(conn, new_position)
+        update_user_budget(conn, position.user_id, budget_delta)
 
 
 def insert_transaction(conn: sqlite3.Connection, transaction: Transaction):
@@ -233,7 +319,7 @@ def insert_transaction(conn: sqlite3.Connection, transaction: Transaction):
             transaction.amount,
         ),
     )
-    conn.commit()
+    commit(conn)
 
 
 def update_position(conn: sqlite3.Connection, position: Position):
@@ -250,7 +336,7 @@ def update_position(conn: sqlite3.Connection, position: Position):
             position.stake_no,
         ),
     )
-    conn.commit()
+    commit(conn)
 
 
 def update_user_budget(conn: sqlite3.Connection, user_id: int, budget_delta: float):
@@ -260,7 +346,7 @@ def update_user_budget(conn: sqlite3.Connection, user_id: int, budget_delta: flo
         update_user_budget_query,
         (budget_delta, user_id),
     )
-    conn.commit()
+    commit(conn)
 
 
 def resolve_updated_positions(
@@ -314,4 +400,48 @@ def remove_position(conn: sqlite3.Connection, position: Position):
     cursor = conn.cursor()
     remove_position_query = load_sql_query("remove_position.sql")
     cursor.execute(remove_position_query, (position.user_id, position.question_id))
-    conn.commit()
+    commit(conn)
+
+
+def record_price_snapshots(
+    conn: sqlite3.Connection,
+    questions: list[Question],
+    timestamp: int | None = None,
+) -> int:
+    """
+    Append a price snapshot for every stored question whose price moved since
+    its last snapshot. Returns the number of snapshots appended.
+    """
+    timestamp = int(time.time()) if timestamp is None else timestamp
+    latest = get_latest_prices(conn, [question.id for question in questions])
+    rows = []
+    for question in questions:
+        if len(question.outcome_probs) < 2:
+            continue
+        prices = (
+            to_fixed_price(question.outcome_probs[0]),
+            to_fixed_price(question.outcome_probs[1]),
+        )
+        if latest.get(question.id) == prices:
+            continue
+        rows.append(
+            {
+                "question_id": question.id,
+                "timestamp": timestamp,
+                "yes_price": prices[0],
+                "no_price": prices[1],
+            }
+        )
+    cursor = conn.cursor()
+    cursor.executemany(load_sql_query("insert_price_snapshot.sql"), rows)
+    commit(conn)
+    return cursor.rowcount if rows else 0
+
+
+def prune_price_snapshots(conn: sqlite3.Connection, retention_days: int):
+    if retention_days <= 0:
+        return
+    cutoff = int(time.time()) - retention_days * 24 * 60 * 60
+    cursor = conn.cursor()
+    cursor.execute(load_sql_query("prune_price_snapshots.sql"), (cutoff,))
+    commit(conn)
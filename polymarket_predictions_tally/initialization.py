@@ -1,6 +1,7 @@
 from platformdirs import user_config_dir, user_data_dir
 import pathlib
 import sqlite3
+import threading
 from polymarket_predictions_tally.database.utils import load_sql_query
 import toml
 from importlib.resources import open_text
@@ -8,25 +9,148 @@ from importlib.resources import open_text
 APP_NAME = "polymarket-predictions-tally"
 data_dir = pathlib.Path(user_data_dir(APP_NAME))
 DB_PATH = data_dir / "database.db"
+CACHE_PATH = data_dir / "api_cache.db"
 
 # Ensure the directory exists
 data_dir.mkdir(parents=True, exist_ok=True)
 
+# Settings connect_db accepts, the values come from the [database] config section
+CONNECTION_PRAGMAS = (
+    "journal_mode",
+    "synchronous",
+    "mmap_size",
+    "cache_size",
+    "temp_store",
+    "busy_timeout",
+)
+
+# Columns added to tables after their first release, as (table, column, type).
+# CREATE TABLE IF NOT EXISTS leaves old tables alone, so these are added by hand.
+ADDED_COLUMNS = [
+    ("questions", "content_hash", "TEXT DEFAULT NULL"),
+]
+
 
 def initialize_db_if_needed():
-    # If the database file doesn't exist, create it and run the initialization script
-    if not DB_PATH.exists():
-        # Ensure the directory exists
-        DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-
-        # Connect to (or create) the database
-        conn = sqlite3.connect(str(DB_PATH))
-        try:
-            sql_script = load_sql_query("setup.sql")
-            conn.executescript(sql_script)
-            conn.commit()
-        finally:
+    # Ensure the directory exists
+    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+
+    # Connect to (or create) the database and run the initialization script.
+    # Every statement in it is IF NOT EXISTS, so on an existing database it
+    # only adds the tables introduced since it was created.
+    conn = sqlite3.connect(str(DB_PATH))
+    try:
+        sql_script = load_sql_query("setup.sql")
+        conn.executescript(sql_script)
+        add_missing_columns(conn)
+        conn.commit()
+        # gather planner statistics for any index the script just created
+        conn.execute("PRAGMA optimize")
+    finally:
+        conn.close()
+
+
+def add_missing_columns(conn: sqlite3.Connection):
+    for table, column, column_type in ADDED_COLUMNS:
+        columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if column not in columns:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+
+
+def connect_db(
+    path=DB_PATH,
+    cached_statements: int = 256,
+    pragmas: dict | None = None,
+    read_only: bool = False,
+    check_same_thread: bool = True,
+) -> sqlite3.Connection:
+    pragmas = dict(pragmas or {})
+    if read_only:
+        # mode=ro fails on write and never creates the file. The journal mode
+        # belongs to the database file, so only the writer may set it
+        target = pathlib.Path(path).resolve().as_uri() + "?mode=ro"
+        pragmas.pop("journal_mode", None)
+    else:
+        target = str(path)
+    conn = sqlite3.connect(
+        target,
+        cached_statements=cached_statements,
+        check_same_thread=check_same_thread,
+        uri=read_only,
+    )
+    try:
+        apply_pragmas(conn, pragmas)
+    except:
+        conn.close()
+        raise
+    return conn
+
+
+class ConnectionProvider:
+    """
+    Hands every thread its own connection to the database, opened on first
+    use with the same settings. sqlite3 connections must not be shared
+    between threads, so workers ask the provider instead of passing one
+    around. Units of work are tracked per connection, so each thread's
+    transaction stays separate.
+    """
+
+    def __init__(
+        self,
+        path=DB_PATH,
+        cached_statements: int = 256,
+        pragmas: dict | None = None,
+        read_only: bool = False,
+    ):
+        self.path = path
+        self.cached_statements = cached_statements
+        self.pragmas = pragmas
+        self.read_only = read_only
+        self.local = threading.local()
+        self.connections: list[sqlite3.Connection] = []
+        self.lock = threading.Lock()
+
+    def connection(self) -> sqlite3.Connection:
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            # the same-thread check is off only so close() can run from the
+            # thread that owns the provider, each connection is still used by
+            # a single thread
+            conn = connect_db(
+                self.path,
+                cached_statements=self.cached_statements,
+                pragmas=self.pragmas,
+                read_only=self.read_only,
+                check_same_thread=False,
+            )
+            self.local.conn = conn
+            with self.lock:
+                self.connections.append(conn)
+        return conn
+
+    def close(self):
+        with self.lock:
+            connections, self.connections = self.connections, []
+        for conn in connections:
             conn.close()
+        self.local = threading.local()
+
+    def __enter__(self) -> "ConnectionProvider":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def apply_pragmas(conn: sqlite3.Connection, pragmas: dict):
+    for name, value in pragmas.items():
+        # PRAGMA takes no parameters, so only known names and plain values
+        # are put into the statement
+        if name not in CONNECTION_PRAGMAS:
+            raise ValueError(f"Unsupported database setting: {name}")
+        if not (isinstance(value, int) or str(value).isalpha()):
+            raise ValueError(f"Invalid value for database setting {name}: {value}")
+        conn.execute(f"PRAGMA {name} = {value}")
 
 
 def initialize_config_if_needed():
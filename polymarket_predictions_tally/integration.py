@@ -1,4 +1,5 @@
 import sqlite3
+import time
 from polymarket_predictions_tally import api
 from polymarket_predictions_tally.cli import prints
 from polymarket_predictions_tally.cli.prints import (
@@ -10,7 +11,11 @@ from polymarket_predictions_tally.cli.user_input import (
     process_prediction,
     prompt_sell,
 )
-from polymarket_predictions_tally.constants import MAX_QUESTIONS
+from polymarket_predictions_tally.constants import (
+    MAX_QUESTIONS,
+    PRICE_HISTORY_RETENTION_DAYS,
+    TAGS,
+)
 from polymarket_predictions_tally.database import read
 from polymarket_predictions_tally.database.read import (
     get_active_question_ids,
@@ -26,65 +31,105 @@ from polymarket_predictions_tally.database.read import (
     get_user_positions,
     get_users_affected_by_update,
 )
+from polymarket_predictions_tally.database.utils import unit_of_work
 from polymarket_predictions_tally.database.write import (
     get_or_make_user,
+    insert_events,
     insert_question,
     insert_response,
     perform_transaction,
+    prune_price_snapshots,
+    record_price_snapshots,
     resolve_updated_positions,
     update_present_questions,
     update_questions,
     update_responses,
     update_users_stats,
 )
+from polymarket_predictions_tally.logic import Question
 
 
-def predict(username: str, conn):
-    user = get_or_make_user(conn, username)
-    api_questions = api.get_questions(tag="Politics", limit=MAX_QUESTIONS)
-    update_present_questions(conn, api_questions)
+def predict(username: str, conn, refresh: bool = False):
+    started_at = time.time()
+    api_questions, fetched_at = api.get_questions_for_tags(
+        TAGS, limit=MAX_QUESTIONS, refresh=refresh
+    )
+    # the prompt runs between the two units so no write lock is held meanwhile
+    with unit_of_work(conn):
+        user = get_or_make_user(conn, username)
+        write_back_listing(conn, api_questions, fetched_at, started_at)
     previous_user_responses = get_previous_user_responses(conn, api_questions, user.id)
     question, response = process_prediction(
         user, api_questions, previous_user_responses
     )
     if response is not None:
-        insert_question(conn, question)
-        insert_response(conn, response)
+        with unit_of_work(conn):
+            insert_question(conn, question)
+            record_price_snapshots(conn, [question], int(fetched_at))
+            insert_response(conn, response)
+
+
+def write_back_listing(
+    conn: sqlite3.Connection,
+    api_questions: list[Question],
+    fetched_at: float,
+    started_at: float,
+):
+    # a listing served from the disk cache can be older than what the last
+    # update stored, so only one fetched during this session is written back
+    if fetched_at < started_at:
+        return
+    update_present_questions(conn, api_questions)
+    record_price_snapshots(conn, api_questions, int(fetched_at))
 
 
 def update_database(conn: sqlite3.Connection):
     question_ids = get_active_question_ids(conn)
-    updated_questions = api.get_questions_by_id_list(question_ids)
     old_questions = get_questions_from_ids(conn, question_ids)
-    update_questions(conn, updated_questions)
-
-    # update predictions
-    resolved_questions = [
-        question
-        for question in updated_questions
-        if question and question.outcome is not None
-    ]
-    all_responses = get_all_responses_to_questions(conn, resolved_questions)
-    update_responses(conn, all_responses, resolved_questions)
-
-    latest_responses = get_latest_responses_to_questions(conn, resolved_questions)
-    update_effects_info = get_users_affected_by_update(
-        conn,
-        latest_responses,
-        resolved_questions,
-    )
-
-    inform_users_of_change(update_effects_info, resolved_questions)
-    update_users_stats(conn, update_effects_info)
-
-    # update bets
-    updated_positions = get_updated_positions(conn, updated_questions)
-    users = get_all_users(conn)
-    users = {user.id: user for user in users}
-    inform_users_of_stocks_change(
-        users, updated_positions, updated_questions, old_questions, resolved_questions
-    )
-    resolve_updated_positions(conn, resolved_questions)
+    tags = {question.id: question.tag for question in old_questions}
+    questions_by_id = api.get_questions_by_id_list(question_ids, tags)
+    updated_questions = [questions_by_id.get(id) for id in question_ids]
+    with unit_of_work(conn):
+        skipped = update_questions(conn, updated_questions)
+        prints.questions_refreshed(
+            sum(question is not None for question in updated_questions), skipped
+        )
+        record_price_snapshots(
+            conn, [question for question in updated_questions if question]
+        )
+        prune_price_snapshots(conn, PRICE_HISTORY_RETENTION_DAYS)
+
+        # update predictions
+        resolved_questions = [
+            question
+            for question in updated_questions
+            if question and question.outcome is not None
+        ]
+        all_responses = get_all_responses_to_questions(conn, resolved_questions)
+        update_responses(conn, all_responses, resolved_questions)
+
+        latest_responses = get_latest_responses_to_questions(conn, resolved_questions)
+        update_effects_info = get_users_affected_by_update(
+            conn,
+            latest_responses,
+            resolved_questions,
+        )
+
+        inform_users_of_change(update_effects_info, resolved_questions)
+        update_users_stats(conn, update_effects_info)
+
+        # update bets
+        updated_positions = get_updated_positions(conn, updated_questions)
+        users = get_all_users(conn)
+        users = {user.id: user for user in users}
+        inform_users_of_stocks_change(
+            users,
+            updated_positions,
+            updated_questions,
+            old_questions,
+            resolved_questions,
+        )
+        resolve_updated_positions(conn, resolved_questions)
 
 
 def history(username: str, conn: sqlite3.Connection):
@@ -107,15 +152,21 @@ def show_users(conn: sqlite3.Connection):
     prints.users(users)
 
 
-def bet(username: str, conn: sqlite3.Connection):
-    user = get_or_make_user(conn, username)
-    api_questions = api.get_questions(tag="Politics", limit=MAX_QUESTIONS)
-    update_present_questions(conn, api_questions)
+def bet(username: str, conn: sqlite3.Connection, refresh: bool = False):
+    started_at = time.time()
+    api_questions, fetched_at = api.get_questions_for_tags(
+        TAGS, limit=MAX_QUESTIONS, refresh=refresh
+    )
+    with unit_of_work(conn):
+        user = get_or_make_user(conn, username)
+        write_back_listing(conn, api_questions, fetched_at, started_at)
     user_positions = get_user_positions(conn, api_questions, user.id)
     question, transaction, position = process_bet(user, api_questions, user_positions)
     if transaction is not None:
-        insert_question(conn, question)
-        perform_transaction(conn, transaction, position, question)
+        with unit_of_work(conn):
+            insert_question(conn, question)
+            record_price_snapshots(conn, [question], int(fetched_at))
+            perform_transaction(conn, transaction, position, question)
 
 
 def sell(username: str, conn: sqlite3.Connection):
@@ -126,3 +177,9 @@ def sell(username: str, conn: sqlite3.Connection):
     transaction, position, question = prompt_sell(user, positions, questions)
     if transaction:
         perform_transaction(conn, transaction, position, question)
+
+
+def ingest_events(conn: sqlite3.Connection, limit: int, refresh: bool = False):
+    events = api.get_events_for_tags(TAGS, limit=limit, refresh=refresh)
+    stored = insert_events(conn, events)
+    prints.events_ingested(len(events), stored)
@@ -122,3 +122,11 @@ class Position:
     question_id: int
     stake_yes: float
     stake_no: float
+
+
+@dataclass
+class PriceSnapshot:
+    question_id: int
+    timestamp: datetime
+    yes_price: float
+    no_price: float
@@ -1,12 +1,20 @@
-import sqlite3
 from polymarket_predictions_tally.cli.command import cli
-from polymarket_predictions_tally.initialization import DB_PATH, initialize_db_if_needed
+from polymarket_predictions_tally.constants import DB_CACHED_STATEMENTS, DB_PRAGMAS
+from polymarket_predictions_tally.initialization import (
+    DB_PATH,
+    ConnectionProvider,
+    initialize_db_if_needed,
+)
 
 
 def main():
     initialize_db_if_needed()
-    with sqlite3.connect(DB_PATH) as conn:
-        cli(obj={"conn": conn})  # Pass the connection here
+    with ConnectionProvider(
+        DB_PATH, cached_statements=DB_CACHED_STATEMENTS, pragmas=DB_PRAGMAS
+    ) as db:
+        # commands run on the main thread's connection, anything they start
+        # in other threads takes its own from db
+        cli(obj={"conn": db.connection(), "db": db})
 
 
 if __name__ == "__main__":
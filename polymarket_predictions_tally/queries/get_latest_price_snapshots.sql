@@ -0,0 +1,6 @@
+SELECT question_id, yes_price, no_price FROM price_snapshots AS snapshot
+WHERE question_id IN (SELECT value FROM json_each(?))
+  AND timestamp = (
+    SELECT MAX(timestamp) FROM price_snapshots
+    WHERE question_id = snapshot.question_id
+  );
@@ -0,0 +1,14 @@
+-- Latest response of a user to every question they answered,
+-- in order of their first response to each question
+SELECT id, user_id, question_id, answer, timestamp, correct, explanation FROM (
+  SELECT
+    *,
+    ROW_NUMBER() OVER (
+      PARTITION BY question_id ORDER BY timestamp DESC, id
+    ) AS recency,
+    MIN(id) OVER (PARTITION BY question_id) AS first_id
+  FROM responses
+  WHERE user_id = ?
+)
+WHERE recency = 1
+ORDER BY first_id;
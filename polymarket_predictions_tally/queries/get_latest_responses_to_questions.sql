@@ -0,0 +1,14 @@
+-- Latest response of every user to each question in a JSON array of ids,
+-- in order of each user's first response to the question
+SELECT id, user_id, question_id, answer, timestamp, correct, explanation FROM (
+  SELECT
+    *,
+    ROW_NUMBER() OVER (
+      PARTITION BY user_id, question_id ORDER BY timestamp DESC, id
+    ) AS recency,
+    MIN(id) OVER (PARTITION BY user_id, question_id) AS first_id
+  FROM responses
+  WHERE question_id IN (SELECT value FROM json_each(?))
+)
+WHERE recency = 1
+ORDER BY first_id;
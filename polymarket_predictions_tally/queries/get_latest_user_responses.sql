@@ -0,0 +1,11 @@
+-- Latest response of a user to each question in a JSON array of ids
+SELECT user_id, question_id, answer, timestamp, correct, explanation FROM (
+  SELECT
+    *,
+    ROW_NUMBER() OVER (
+      PARTITION BY question_id ORDER BY timestamp DESC, id
+    ) AS recency
+  FROM responses
+  WHERE user_id = ? AND question_id IN (SELECT value FROM json_each(?))
+)
+WHERE recency = 1;
@@ -0,0 +1,3 @@
+SELECT question_id, timestamp, yes_price, no_price FROM price_snapshots
+WHERE question_id = ? AND timestamp BETWEEN ? AND ?
+ORDER BY timestamp;
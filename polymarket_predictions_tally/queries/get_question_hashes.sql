@@ -0,0 +1,2 @@
+SELECT id, content_hash FROM questions
+WHERE id IN (SELECT value FROM json_each(?));
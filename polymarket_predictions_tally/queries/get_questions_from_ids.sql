@@ -0,0 +1,10 @@
+SELECT 
+  id,
+  question,
+  outcome_probs,
+  outcomes,
+  tag,
+  outcome,
+  end_date,
+  description
+FROM questions WHERE id IN (SELECT value FROM json_each(?));
@@ -0,0 +1,2 @@
+SELECT * FROM positions
+WHERE user_id = ? AND question_id IN (SELECT value FROM json_each(?));
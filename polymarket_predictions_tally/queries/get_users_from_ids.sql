@@ -0,0 +1 @@
+SELECT * FROM users WHERE id IN (SELECT value FROM json_each(?));
@@ -1,2 +1,4 @@
 SELECT user_id, question_id, answer, timestamp, correct, explanation FROM responses
-WHERE user_id = ? AND question_id = ?; 
+WHERE user_id = ? AND question_id = ?
+ORDER BY timestamp DESC, id
+LIMIT 1;
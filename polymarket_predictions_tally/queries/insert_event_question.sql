@@ -0,0 +1,3 @@
+INSERT INTO event_questions (event_id, question_id)
+VALUES (?, ?)
+ON CONFLICT DO NOTHING;
@@ -0,0 +1,9 @@
+-- Only questions stored in the database get a history, and a snapshot never
+-- lands behind a newer one, so stale cached prices can't rewrite the past
+INSERT OR IGNORE INTO price_snapshots (question_id, timestamp, yes_price, no_price)
+SELECT :question_id, :timestamp, :yes_price, :no_price
+WHERE EXISTS (SELECT 1 FROM questions WHERE id = :question_id)
+AND NOT EXISTS (
+    SELECT 1 FROM price_snapshots
+    WHERE question_id = :question_id AND timestamp > :timestamp
+);
@@ -1,4 +1,4 @@
 -- Add a new question
-INSERT INTO questions (id, question, tag, end_date, description, outcome, outcome_probs, outcomes)
-VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+INSERT INTO questions (id, question, tag, end_date, description, outcome, outcome_probs, outcomes, content_hash)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
 ON CONFLICT DO NOTHING;
@@ -0,0 +1,8 @@
+-- Drop snapshots older than the cutoff, keeping each question's latest one
+-- so the next refresh still has a price to compare against
+DELETE FROM price_snapshots AS snapshot
+WHERE timestamp < ?
+  AND timestamp < (
+    SELECT MAX(timestamp) FROM price_snapshots
+    WHERE question_id = snapshot.question_id
+  );
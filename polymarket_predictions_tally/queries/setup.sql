@@ -15,7 +15,8 @@ CREATE TABLE IF NOT EXISTS questions (
     description TEXT,
     outcome BOOLEAN DEFAULT NULL,  
     outcome_probs TEXT NOT NULL,  -- JSON array of probabilities
-    outcomes TEXT NOT NULL  -- JSON array of possible outcomes
+    outcomes TEXT NOT NULL,  -- JSON array of possible outcomes
+    content_hash TEXT DEFAULT NULL  -- hash of the fields a refresh can change
 );
 
 -- Responses table: stores each user's prediction for a given question
@@ -65,3 +66,52 @@ CREATE TABLE IF NOT EXISTS positions (
     FOREIGN KEY (user_id) REFERENCES users(id),
     FOREIGN KEY (question_id) REFERENCES questions(id)
 );
+
+-- Indexes for the lookups on non key columns
+CREATE INDEX IF NOT EXISTS responses_question_id
+    ON responses (question_id);
+
+CREATE INDEX IF NOT EXISTS responses_user_question_timestamp
+    ON responses (user_id, question_id, timestamp);
+
+CREATE INDEX IF NOT EXISTS positions_question_id
+    ON positions (question_id);
+
+CREATE INDEX IF NOT EXISTS transactions_user_question
+    ON transactions (user_id, question_id);
+
+CREATE INDEX IF NOT EXISTS stats_user_id
+    ON stats (user_id);
+
+-- Only unresolved questions, which is what every refresh lists
+CREATE INDEX IF NOT EXISTS questions_active
+    ON questions (id) WHERE outcome IS NULL;
+
+-- Events table: groups of related markets as listed by the events endpoint
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    end_date DATETIME
+);
+
+CREATE TABLE IF NOT EXISTS event_questions (
+    event_id INTEGER NOT NULL,
+    question_id INTEGER NOT NULL,
+    PRIMARY KEY (event_id, question_id),
+    FOREIGN KEY (event_id) REFERENCES events(id),
+    FOREIGN KEY (question_id) REFERENCES questions(id)
+);
+
+-- Price history: one row per question each time its price moves.
+-- Prices are fixed point (price * 10000) and timestamps unix epoch seconds.
+CREATE TABLE IF NOT EXISTS price_snapshots (
+    question_id INTEGER NOT NULL,
+    timestamp INTEGER NOT NULL,
+    yes_price INTEGER NOT NULL,
+    no_price INTEGER NOT NULL,
+    PRIMARY KEY (question_id, timestamp),
+    FOREIGN KEY (question_id) REFERENCES questions(id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS price_snapshots_timestamp
+    ON price_snapshots (timestamp);
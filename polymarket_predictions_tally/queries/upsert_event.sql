@@ -0,0 +1,4 @@
+INSERT INTO events (id, title, end_date)
+VALUES (?, ?, ?)
+ON CONFLICT(id)
+DO UPDATE SET title = excluded.title, end_date = excluded.end_date;
@@ -0,0 +1,8 @@
+-- Add a question, or refresh the columns the api can change on a stored one
+INSERT INTO questions (id, question, tag, end_date, description, outcome, outcome_probs, outcomes, content_hash)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    end_date = excluded.end_date,
+    outcome = excluded.outcome,
+    outcome_probs = excluded.outcome_probs,
+    content_hash = excluded.content_hash;
@@ -0,0 +1,4 @@
+-- Whether the user and the question of a response exist, two primary key probes
+SELECT
+    EXISTS (SELECT 1 FROM users WHERE id = ?),
+    EXISTS (SELECT 1 FROM questions WHERE id = ?);
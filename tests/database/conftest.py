@@ -0,0 +1,22 @@
+from datetime import datetime
+import pytest
+from polymarket_predictions_tally.logic import Question
+
+
+@pytest.fixture
+def make_question():
+    """Factory for an open yes/no question, the price defaults to a coin flip."""
+
+    def make(id: int, yes_price: float = 0.5) -> Question:
+        return Question(
+            id=id,
+            question=f"Question {id}?",
+            outcome_probs=[yes_price, round(1 - yes_price, 4)],
+            outcomes=["Yes", "No"],
+            tag="Politics",
+            outcome=None,
+            end_date=datetime(2025, 4, 1),
+            description="desc",
+        )
+
+    return make
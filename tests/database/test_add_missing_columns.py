@@ -0,0 +1,34 @@
+import sqlite3
+from polymarket_predictions_tally.database.utils import load_sql_query
+from polymarket_predictions_tally.initialization import add_missing_columns
+
+
+def test_add_missing_columns_upgrades_old_questions_table():
+    with sqlite3.connect(":memory:") as conn:
+        # questions table as created before content_hash existed
+        conn.execute(
+            """CREATE TABLE questions (
+                id INTEGER PRIMARY KEY,
+                question TEXT NOT NULL,
+                tag TEXT,
+                end_date DATETIME,
+                description TEXT,
+                outcome BOOLEAN DEFAULT NULL,
+                outcome_probs TEXT NOT NULL,
+                outcomes TEXT NOT NULL
+            )"""
+        )
+        conn.executescript(load_sql_query("setup.sql"))
+        add_missing_columns(conn)
+
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(questions)")]
+        assert columns[-1] == "content_hash"
+
+
+def test_add_missing_columns_is_idempotent():
+    with sqlite3.connect(":memory:") as conn:
+        conn.executescript(load_sql_query("setup.sql"))
+        add_missing_columns(conn)
+        add_missing_columns(conn)
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(questions)")]
+        assert columns.count("content_hash") == 1
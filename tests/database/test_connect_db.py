@@ -0,0 +1,53 @@
+import pytest
+from polymarket_predictions_tally.database.benchmark import (
+    SQLITE_DEFAULTS,
+    WAL,
+    compare_profiles,
+)
+from polymarket_predictions_tally.initialization import connect_db
+
+
+def test_connect_db_applies_pragmas(tmp_path):
+    pragmas = {
+        "journal_mode": "wal",
+        "synchronous": "normal",
+        "cache_size": -4000,
+        "temp_store": "memory",
+        "busy_timeout": 1234,
+    }
+    conn = connect_db(tmp_path / "test.db", pragmas=pragmas)
+    try:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        # NORMAL is 1
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -4000
+        # MEMORY is 2
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 1234
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize(
+    "pragmas",
+    [
+        {"user_version": 3},
+        {"journal_mode": "wal; DROP TABLE users"},
+    ],
+)
+def test_connect_db_rejects_unknown_settings(tmp_path, pragmas):
+    with pytest.raises(ValueError):
+        connect_db(tmp_path / "test.db", pragmas=pragmas)
+
+
+def test_compare_profiles_times_every_step():
+    results = compare_profiles({"defaults": SQLITE_DEFAULTS, "wal": WAL}, 5)
+
+    assert list(results) == ["defaults", "wal"]
+    for timings in results.values():
+        assert list(timings) == [
+            "insert questions",
+            "insert responses",
+            "refresh",
+            "read",
+        ]
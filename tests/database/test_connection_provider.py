@@ -0,0 +1,69 @@
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from polymarket_predictions_tally.database.read import get_all_users
+from polymarket_predictions_tally.database.utils import load_sql_query, unit_of_work
+from polymarket_predictions_tally.database.write import insert_user_by_name
+from polymarket_predictions_tally.initialization import ConnectionProvider, connect_db
+
+PRAGMAS = {"journal_mode": "wal", "busy_timeout": 5000}
+
+
+def setup_db(path):
+    conn = connect_db(path, pragmas=PRAGMAS)
+    conn.executescript(load_sql_query("setup.sql"))
+    conn.close()
+
+
+def test_each_thread_gets_its_own_connection(tmp_path):
+    setup_db(tmp_path / "test.db")
+    with ConnectionProvider(tmp_path / "test.db", pragmas=PRAGMAS) as db:
+        main_conn = db.connection()
+        assert db.connection() is main_conn
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            worker_conn = executor.submit(db.connection).result()
+        assert worker_conn is not main_conn
+
+
+def test_threads_write_concurrently(tmp_path):
+    setup_db(tmp_path / "test.db")
+    with ConnectionProvider(tmp_path / "test.db", pragmas=PRAGMAS) as db:
+
+        def add_users(worker: int):
+            conn = db.connection()
+            with unit_of_work(conn):
+                for i in range(20):
+                    insert_user_by_name(conn, f"user{worker}-{i}")
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(add_users, range(4)))
+
+        assert len(get_all_users(db.connection())) == 80
+
+
+def test_close_closes_every_thread_connection(tmp_path):
+    setup_db(tmp_path / "test.db")
+    db = ConnectionProvider(tmp_path / "test.db")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        worker_conn = executor.submit(db.connection).result()
+    db.close()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        worker_conn.execute("SELECT 1")
+
+
+def test_read_only_connections_cannot_write(tmp_path):
+    setup_db(tmp_path / "test.db")
+    with ConnectionProvider(
+        tmp_path / "test.db", pragmas=PRAGMAS, read_only=True
+    ) as db:
+        conn = db.connection()
+        assert get_all_users(conn) == []
+        with pytest.raises(sqlite3.OperationalError):
+            insert_user_by_name(conn, "alice")
+
+
+def test_read_only_does_not_create_the_database(tmp_path):
+    with pytest.raises(sqlite3.OperationalError):
+        connect_db(tmp_path / "missing.db", read_only=True)
+    assert not (tmp_path / "missing.db").exists()
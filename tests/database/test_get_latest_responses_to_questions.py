@@ -87,3 +87,52 @@ def test_get_latest_responses_to_questions():
         assert latest_responses[0][1].answer == "No"  # Latest answer is "No"
         assert 2 in latest_responses[1]  # User 2's response to question 2
         assert latest_responses[1][2].answer == "Yes"  # Their answer is "Yes"
+
+
+def test_get_latest_responses_to_questions_without_responses():
+    with sqlite3.connect(":memory:") as conn:
+        conn.executescript(load_sql_query("setup.sql"))
+        question = Question(
+            id=1,
+            question="Will it rain tomorrow?",
+            outcome_probs=[0.6, 0.4],
+            outcomes=["Yes", "No"],
+            tag="Weather",
+            outcome=None,
+            end_date=datetime.datetime(2025, 2, 20, 12, 0),
+            description="Weather forecast prediction.",
+        )
+        insert_question(conn, question)
+        insert_user_by_name(conn, "JohnDoe")
+        insert_user_by_name(conn, "JaneDoe")
+        for user_id, answer, hour in [(1, "Yes", 10), (2, "No", 11), (2, "Yes", 9)]:
+            insert_response(
+                conn,
+                Response(
+                    user_id=user_id,
+                    question_id=1,
+                    answer=answer,
+                    timestamp=datetime.datetime(2025, 2, 19, hour, 0),
+                    correct=None,
+                    explanation=None,
+                ),
+            )
+        unanswered = Question(
+            id=2,
+            question="Unanswered",
+            outcome_probs=[0.5, 0.5],
+            outcomes=["Yes", "No"],
+            tag="Weather",
+            outcome=None,
+            end_date=datetime.datetime(2025, 2, 20, 12, 0),
+            description="",
+        )
+
+        latest_responses = get_latest_responses_to_questions(
+            conn, [unanswered, question]
+        )
+
+        assert latest_responses[0] == {}
+        assert list(latest_responses[1]) == [1, 2]
+        assert latest_responses[1][2].answer == "No"
+        assert latest_responses[1][2].timestamp == datetime.datetime(2025, 2, 19, 11)
@@ -0,0 +1,66 @@
+import sqlite3
+from datetime import datetime
+from polymarket_predictions_tally.database.read import (
+    get_previous_user_responses,
+    get_user_positions,
+    has_user_answered,
+)
+from polymarket_predictions_tally.database.utils import load_sql_query
+from polymarket_predictions_tally.database.write import (
+    insert_question,
+    insert_response,
+    insert_user,
+    update_position,
+)
+from polymarket_predictions_tally.logic import Position, Question, Response, User
+
+
+def make_response(user_id: int, question_id: int, answer: str, day: int) -> Response:
+    return Response(
+        user_id=user_id,
+        question_id=question_id,
+        answer=answer,
+        timestamp=datetime(2025, 1, day),
+        correct=None,
+        explanation=None,
+    )
+
+
+def setup_db(conn: sqlite3.Connection, make_question) -> list[Question]:
+    conn.executescript(load_sql_query("setup.sql"))
+    insert_user(conn, User(id=1, username="Alice", budget=1000))
+    insert_user(conn, User(id=2, username="Bob", budget=1000))
+    questions = [make_question(id) for id in (1, 2, 3)]
+    for question in questions:
+        insert_question(conn, question)
+    return questions
+
+
+def test_get_previous_user_responses_latest_per_question(make_question):
+    with sqlite3.connect(":memory:") as conn:
+        questions = setup_db(conn, make_question)
+        insert_response(conn, make_response(1, 1, "Yes", 1))
+        insert_response(conn, make_response(1, 1, "No", 3))
+        insert_response(conn, make_response(1, 1, "Yes", 2))
+        insert_response(conn, make_response(1, 3, "No", 1))
+        insert_response(conn, make_response(2, 2, "Yes", 1))
+
+        responses = get_previous_user_responses(conn, questions, 1)
+
+        assert len(responses) == 3
+        assert responses[0] is not None and responses[0].answer == "No"
+        assert responses[1] is None  # only Bob answered question 2
+        assert responses[2] is not None and responses[2].answer == "No"
+        latest = has_user_answered(conn, 1, 1)
+        assert latest is not None and latest.answer == "No"
+
+
+def test_get_user_positions_aligned_with_questions(make_question):
+    with sqlite3.connect(":memory:") as conn:
+        questions = setup_db(conn, make_question)
+        update_position(conn, Position(1, 3, 10.0, 0.0))
+        update_position(conn, Position(2, 1, 5.0, 0.0))
+
+        positions = get_user_positions(conn, questions, 1)
+
+        assert positions == [None, None, Position(1, 3, 10.0, 0.0)]
@@ -0,0 +1,37 @@
+import sqlite3
+from polymarket_predictions_tally.database.read import get_questions_from_ids
+from polymarket_predictions_tally.database.utils import load_sql_query
+from polymarket_predictions_tally.database.write import insert_question
+
+
+def test_get_questions_from_ids_keeps_input_order(make_question):
+    with sqlite3.connect(":memory:") as conn:
+        conn.executescript(load_sql_query("setup.sql"))
+        for id in range(1, 6):
+            insert_question(conn, make_question(id))
+
+        questions = get_questions_from_ids(conn, [4, 1, 5, 1])
+
+        assert [question.id for question in questions] == [4, 1, 5, 1]
+        assert questions[0] == make_question(4)
+
+
+def test_get_questions_from_ids_many_ids(make_question):
+    with sqlite3.connect(":memory:") as conn:
+        conn.executescript(load_sql_query("setup.sql"))
+        ids = list(range(1, 2001))
+        for id in ids:
+            insert_question(conn, make_question(id))
+
+        # more ids than SQLite allows as bound variables in older builds
+        questions = get_questions_from_ids(conn, ids[::-1])
+        assert [question.id for question in questions] == ids[::-1]
+        assert get_questions_from_ids(conn, []) == []
+
+
+def test_get_questions_from_ids_missing_question(make_question):
+    with sqlite3.connect(":memory:") as conn:
+        conn.executescript(load_sql_query("setup.sql"))
+        insert_question(conn, make_question(1))
+        questions = get_questions_from_ids(conn, [2, 1])
+        assert questions == [None, make_question(1)]
@@ -0,0 +1,17 @@
+import sqlite3
+from polymarket_predictions_tally.database.read import get_users_from_ids
+from polymarket_predictions_tally.database.utils import load_sql_query
+from polymarket_predictions_tally.database.write import insert_user
+from polymarket_predictions_tally.logic import User
+
+
+def test_get_users_from_ids():
+    with sqlite3.connect(":memory:") as conn:
+        conn.executescript(load_sql_query("setup.sql"))
+        alice = User(id=1, username="Alice", budget=1000)
+        bob = User(id=2, username="Bob", budget=500)
+        insert_user(conn, alice)
+        insert_user(conn, bob)
+
+        assert get_users_from_ids(conn, [2, 1, 3]) == {1: alice, 2: bob}
+        assert get_users_from_ids(conn, []) == {}
@@ -0,0 +1,34 @@
+import sqlite3
+import pytest
+from polymarket_predictions_tally.database.utils import load_sql_query
+
+
+@pytest.mark.parametrize(
+    "query_file, params, index",
+    [
+        ("get_responses_to_question.sql", (1,), "responses_question_id"),
+        ("has_user_answered.sql", (1, 1), "responses_user_question_timestamp"),
+        ("get_all_responses.sql", (1,), "responses_user_question_timestamp"),
+        ("get_positions_on_question.sql", (1,), "positions_question_id"),
+        ("list_active_questions.sql", (), "questions_active"),
+        ("update_user_stats.sql", (1, 0, 1), "stats_user_id"),
+    ],
+)
+def test_hot_queries_use_an_index(query_file, params, index):
+    with sqlite3.connect(":memory:") as conn:
+        conn.executescript(load_sql_query("setup.sql"))
+        query = load_sql_query(query_file)
+        plan = conn.execute(f"EXPLAIN QUERY PLAN {query}", params).fetchall()
+        details = " ".join(row[-1] for row in plan)
+        assert index in details
+
+
+def test_transactions_index_exists():
+    with sqlite3.connect(":memory:") as conn:
+        conn.executescript(load_sql_query("setup.sql"))
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN "
+            "SELECT * FROM transactions WHERE user_id = ? AND question_id = ?",
+            (1, 1),
+        ).fetchall()
+        assert "transactions_user_question" in " ".join(row[-1] for row in plan)
@@ -0,0 +1,69 @@
+import sqlite3
+from datetime import datetime
+from polymarket_predictions_tally.database.utils import load_sql_query
+from polymarket_predictions_tally.database.write import insert_events
+from polymarket_predictions_tally.logic import Event
+
+
+def test_insert_events_stores_events_and_markets(make_question):
+    with sqlite3.connect(":memory:") as conn:
+        conn.executescript(load_sql_query("setup.sql"))
+        events = [
+            Event(
+                id=1,
+                title="Election",
+                questions=[make_question(1), make_question(2)],
+                end_date=datetime(2025, 4, 1),
+            ),
+            # market 2 shows up again under a second event
+            Event(
+                id=2,
+                title="Cabinet",
+                questions=[make_question(2), make_question(3)],
+                end_date=datetime(2025, 5, 1),
+            ),
+            # and the first event again, as when it is listed by two tags
+            Event(
+                id=1,
+                title="Election",
+                questions=[make_question(1)],
+                end_date=datetime(2025, 4, 1),
+            ),
+        ]
+
+        stored = insert_events(conn, events)
+
+        assert stored == 3
+        cursor = conn.cursor()
+        cursor.execute("SELECT id, title FROM events ORDER BY id")
+        assert cursor.fetchall() == [(1, "Election"), (2, "Cabinet")]
+        cursor.execute("SELECT id FROM questions ORDER BY id")
+        assert cursor.fetchall() == [(1,), (2,), (3,)]
+        cursor.execute(
+            "SELECT event_id, question_id FROM event_questions ORDER BY 1, 2"
+        )
+        assert cursor.fetchall() == [(1, 1), (1, 2), (2, 2), (2, 3)]
+        # every market gets its first price snapshot along with the row
+        cursor.execute("SELECT question_id FROM price_snapshots ORDER BY 1")
+        assert cursor.fetchall() == [(1,), (2,), (3,)]
+
+
+def test_insert_events_keeps_existing_questions(make_question):
+    with sqlite3.connect(":memory:") as conn:
+        conn.executescript(load_sql_query("setup.sql"))
+        event = Event(
+            id=1,
+            title="Election",
+            questions=[make_question(1)],
+            end_date=datetime(2025, 4, 1),
+        )
+        assert insert_events(conn, [event]) == 1
+        event.title = "Election (updated)"
+        # the market is already stored, so nothing new is counted
+        assert insert_events(conn, [event]) == 0
+
+        cursor = conn.cursor()
+        cursor.execute("SELECT title FROM events")
+        assert cursor.fetchall() == [("Election (updated)",)]
+        cursor.execute("SELECT COUNT(*) FROM event_questions")
+        assert cursor.fetchone()[0] == 1
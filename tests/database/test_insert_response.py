@@ -1,6 +1,9 @@
 from datetime import datetime
 import sqlite3
-from polymarket_predictions_tally.database.read import has_user_answered
+from polymarket_predictions_tally.database.read import (
+    has_user_answered,
+    validate_response,
+)
 from polymarket_predictions_tally.database.utils import load_sql_query
 from polymarket_predictions_tally.database.write import (
     insert_question,
@@ -171,6 +174,19 @@ def test_insert_response_invalid_question():
         )
 
 
+def test_validate_response_checks_user_and_question():
+    with sqlite3.connect(":memory:") as conn:
+        setup_db(conn)
+
+        def response(user_id: int, question_id: int) -> Response:
+            return Response(user_id, question_id, "Yes", datetime.now(), None, None)
+
+        assert validate_response(conn, response(1, 1)) == (True, True)
+        assert validate_response(conn, response(999, 1)) == (False, True)
+        assert validate_response(conn, response(1, 999)) == (True, False)
+        assert validate_response(conn, response(999, 999)) == (False, False)
+
+
 def test_has_user_answered_returns_response():
     """Test that has_user_answered returns a Response when a user has answered the question."""
     with sqlite3.connect(":memory:") as conn:
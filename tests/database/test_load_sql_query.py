@@ -0,0 +1,12 @@
+from polymarket_predictions_tally.database.utils import load_sql_query
+
+
+def test_load_sql_query_reads_each_file_once():
+    load_sql_query.cache_clear()
+    first = load_sql_query("get_user.sql")
+    assert "FROM users" in first
+    assert load_sql_query.cache_info().misses == 1
+
+    # later calls hand out the same string without touching the file
+    assert load_sql_query("get_user.sql") is first
+    assert load_sql_query.cache_info().hits == 1
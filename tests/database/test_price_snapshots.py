@@ -0,0 +1,80 @@
+import sqlite3
+from datetime import datetime, timezone
+from polymarket_predictions_tally.database.read import get_price_history
+from polymarket_predictions_tally.database.utils import load_sql_query
+from polymarket_predictions_tally.database.write import (
+    insert_question,
+    prune_price_snapshots,
+    record_price_snapshots,
+)
+
+
+def setup_db(conn: sqlite3.Connection, make_question):
+    conn.executescript(load_sql_query("setup.sql"))
+    insert_question(conn, make_question(1, 0.5))
+    insert_question(conn, make_question(2, 0.5))
+
+
+def test_record_price_snapshots_skips_unchanged_prices(make_question):
+    with sqlite3.connect(":memory:") as conn:
+        setup_db(conn, make_question)
+
+        assert record_price_snapshots(conn, [make_question(1, 0.5)], 100) == 1
+        assert record_price_snapshots(conn, [make_question(1, 0.5)], 200) == 0
+        assert record_price_snapshots(conn, [make_question(1, 0.61)], 300) == 1
+        # question 3 is not stored so it gets no history
+        assert record_price_snapshots(conn, [make_question(3, 0.5)], 300) == 0
+
+        history = get_price_history(conn, 1)
+        assert [snapshot.timestamp.timestamp() for snapshot in history] == [100, 300]
+        assert history[1].yes_price == 0.61
+        assert history[1].no_price == 0.39
+
+        cursor = conn.cursor()
+        cursor.execute("SELECT yes_price, no_price FROM price_snapshots")
+        assert cursor.fetchall() == [(5000, 5000), (6100, 3900)]
+
+
+def test_record_price_snapshots_never_lands_behind_a_newer_one(make_question):
+    with sqlite3.connect(":memory:") as conn:
+        setup_db(conn, make_question)
+        record_price_snapshots(conn, [make_question(1, 0.5)], 100)
+        record_price_snapshots(conn, [make_question(1, 0.6)], 300)
+
+        # prices fetched at 200 and only written now, e.g. from a cached listing
+        assert record_price_snapshots(conn, [make_question(1, 0.55)], 200) == 0
+
+        history = get_price_history(conn, 1)
+        assert [snapshot.timestamp.timestamp() for snapshot in history] == [100, 300]
+
+
+def test_get_price_history_range(make_question):
+    with sqlite3.connect(":memory:") as conn:
+        setup_db(conn, make_question)
+        for timestamp, price in [(100, 0.1), (200, 0.2), (300, 0.3), (400, 0.4)]:
+            record_price_snapshots(
+                conn, [make_question(1, price), make_question(2, price)], timestamp
+            )
+
+        history = get_price_history(
+            conn,
+            2,
+            start=datetime.fromtimestamp(200, tz=timezone.utc),
+            end=datetime.fromtimestamp(300, tz=timezone.utc),
+        )
+        assert [snapshot.yes_price for snapshot in history] == [0.2, 0.3]
+        assert all(snapshot.question_id == 2 for snapshot in history)
+
+
+def test_prune_price_snapshots_keeps_latest(make_question):
+    with sqlite3.connect(":memory:") as conn:
+        setup_db(conn, make_question)
+        record_price_snapshots(conn, [make_question(1, 0.1)], 100)
+        record_price_snapshots(conn, [make_question(1, 0.2)], 200)
+        record_price_snapshots(conn, [make_question(2, 0.3)], 100)
+
+        prune_price_snapshots(conn, retention_days=1)
+
+        cursor = conn.cursor()
+        cursor.execute("SELECT question_id, timestamp FROM price_snapshots")
+        assert sorted(cursor.fetchall()) == [(1, 200), (2, 100)]
@@ -0,0 +1,64 @@
+import sqlite3
+import pytest
+from polymarket_predictions_tally.database.read import get_all_users
+from polymarket_predictions_tally.database.utils import load_sql_query, unit_of_work
+from polymarket_predictions_tally.database.write import insert_user_by_name
+
+
+def connect(path) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.executescript(load_sql_query("setup.sql"))
+    return conn
+
+
+def usernames(conn: sqlite3.Connection) -> list[str]:
+    return [user.username for user in get_all_users(conn)]
+
+
+def test_unit_of_work_commits_once_on_exit(tmp_path):
+    path = tmp_path / "test.db"
+    conn, other = connect(path), connect(path)
+
+    with unit_of_work(conn):
+        insert_user_by_name(conn, "alice")
+        insert_user_by_name(conn, "bob")
+        # the writers did not commit, so nothing is visible from outside yet
+        assert conn.in_transaction
+        assert usernames(other) == []
+
+    assert not conn.in_transaction
+    assert usernames(other) == ["alice", "bob"]
+    conn.close()
+    other.close()
+
+
+def test_unit_of_work_rolls_back_on_error(tmp_path):
+    conn = connect(tmp_path / "test.db")
+    insert_user_by_name(conn, "alice")
+
+    with pytest.raises(RuntimeError):
+        with unit_of_work(conn):
+            insert_user_by_name(conn, "bob")
+            raise RuntimeError("boom")
+
+    assert usernames(conn) == ["alice"]
+    # writers commit on their own again once the unit is closed
+    insert_user_by_name(conn, "carol")
+    assert not conn.in_transaction
+    conn.close()
+
+
+def test_nested_unit_of_work_joins_outer(tmp_path):
+    path = tmp_path / "test.db"
+    conn, other = connect(path), connect(path)
+
+    with pytest.raises(RuntimeError):
+        with unit_of_work(conn):
+            with unit_of_work(conn):
+                insert_user_by_name(conn, "alice")
+            assert usernames(other) == []
+            raise RuntimeError("boom")
+
+    assert usernames(conn) == []
+    conn.close()
+    other.close()
@@ -12,7 +12,7 @@ from polymarket_predictions_tally.utils import (
 
 
 def test_update_existing_question_success():
-    """Test that updating an existing question correctly changes all fields."""
+    """Test that updating an existing question changes only the mutable fields."""
     with sqlite3.connect(":memory:") as conn:
         # Set up the schema
         start_db = load_sql_query("setup.sql")
@@ -54,14 +54,14 @@ def test_update_existing_question_success():
         # (id, question, tag, end_date, description, resolved, outcome, outcome_probs, outcomes)
         assert result is not None
         assert result[0] == 1
-        assert result[1] == "Updated question?"
-        assert result[2] == "updated_tag"
+        assert result[1] == "Original question?"
+        assert result[2] == "general"
         # Convert the stored datetime string into a datetime object for comparison
         assert parse_datetime(result[3]) == datetime(2025, 2, 2)
-        assert result[4] == "Updated description"
+        assert result[4] == "Original description"
         assert result[5]
         assert json.loads(result[6]) == [0.7, 0.3]
-        assert json.loads(result[7]) == ["Maybe", "Definitely"]
+        assert json.loads(result[7]) == ["Yes", "No"]
 
 
 def test_update_nonexistent_question():
@@ -132,13 +132,13 @@ def test_multiple_updates():
 
         # Verify that question1 is updated
         assert result1 is not None
-        assert result1[1] == "Updated question one?"
-        assert result1[2] == "updated_tag1"
+        assert result1[1] == "Question one?"
+        assert result1[2] == "tag1"
         assert parse_datetime(result1[3]) == datetime(2025, 1, 10)
-        assert result1[4] == "Updated first question"
+        assert result1[4] == "First question"
         assert result1[5]
         assert json.loads(result1[6]) == [0.9, 0.1]
-        assert json.loads(result1[7]) == ["X", "Y"]
+        assert json.loads(result1[7]) == ["A", "B"]
 
         # Verify that question2 remains unchanged
         assert result2 is not None
@@ -3,6 +3,7 @@ from datetime import datetime
 from polymarket_predictions_tally.database.utils import load_sql_query
 from polymarket_predictions_tally.database.write import (
     insert_question,
+    update_present_questions,
     update_questions,
 )
 from polymarket_predictions_tally.logic import Question
@@ -50,12 +51,12 @@ def test_update_questions_updates_existing_question():
         )
         row = cursor.fetchone()
 
-        # Assert that the values were updated.
+        # Assert that the outcome was updated and the text was kept.
         assert row is not None
-        assert row[0] == "Updated question"
+        assert row[0] == "Initial question"
         # SQLite stores booleans as integers, so True should be 1.
         assert row[1] == 1
-        assert row[2] == "Updated description"
+        assert row[2] == "Initial description"
 
 
 def test_update_questions_skips_none():
@@ -88,3 +89,68 @@ def test_update_questions_skips_none():
         # Outcome remains NULL (None in Python).
         assert row[1] is None
         assert row[2] == "Initial description"
+
+
+def test_update_questions_skips_unchanged_questions():
+    with sqlite3.connect(":memory:") as conn:
+        create_questions_table(conn)
+        question = Question(
+            id=1,
+            question="Initial question",
+            outcome_probs=[0.5, 0.5],
+            outcomes=["Yes", "No"],
+            tag="Politics",
+            outcome=None,
+            end_date=datetime(2025, 1, 1),
+            description="Initial description",
+        )
+        insert_question(conn, question)
+        moved = Question(
+            id=2,
+            question="Second question",
+            outcome_probs=[0.5, 0.5],
+            outcomes=["Yes", "No"],
+            tag="Politics",
+            outcome=None,
+            end_date=datetime(2025, 1, 1),
+            description="Second description",
+        )
+        insert_question(conn, moved)
+        moved.outcome_probs = [0.6, 0.4]
+
+        changes_before = conn.total_changes
+        skipped = update_questions(conn, [question, moved, None])
+
+        assert skipped == 1
+        # only the moved question was rewritten, in place
+        assert conn.total_changes - changes_before == 1
+        cursor = conn.cursor()
+        cursor.execute("SELECT outcome_probs FROM questions WHERE id = 2")
+        assert cursor.fetchone()[0] == "[0.6, 0.4]"
+
+
+def test_update_present_questions_only_touches_stored_questions():
+    with sqlite3.connect(":memory:") as conn:
+        create_questions_table(conn)
+        stored = Question(
+            id=1,
+            question="Stored question",
+            outcome_probs=[0.5, 0.5],
+            outcomes=["Yes", "No"],
+            tag="Politics",
+            outcome=None,
+            end_date=datetime(2025, 1, 1),
+            description="Stored description",
+        )
+        insert_question(conn, stored)
+        moved = Question(**{**stored.__dict__, "outcome_probs": [0.7, 0.3]})
+        unstored = Question(**{**stored.__dict__, "id": 2})
+
+        skipped = update_present_questions(conn, [moved, unstored])
+
+        assert skipped == 0
+        cursor = conn.cursor()
+        cursor.execute("SELECT id, outcome_probs FROM questions")
+        assert cursor.fetchall() == [(1, "[0.7, 0.3]")]
+
+        assert update_present_questions(conn, [moved, unstored]) == 1
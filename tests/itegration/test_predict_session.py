@@ -1,3 +1,4 @@
+import time
 from datetime import datetime
 import sqlite3
 import click
@@ -12,7 +13,7 @@ from polymarket_predictions_tally.logic import Question, User
 
 
 def test_predict_session(monkeypatch):
-    monkeypatch.setattr(api, "get_questions", fake_get_questions)
+    monkeypatch.setattr(api, "get_questions_for_tags", fake_get_questions_for_tags)
     monkeypatch.setattr(api, "get_questions_by_id_list", fake_get_questions_by_id_list)
     with sqlite3.connect(":memory:") as conn:
         start_db = load_sql_query("setup.sql")
@@ -51,8 +52,8 @@ Stats: 1[+] 0[-]"""
         assert history_stdout.output.strip() in expected_stdout
 
 
-def fake_get_questions_by_id_list(question_ids):
-    return [
+def fake_get_questions_by_id_list(question_ids, tags=None):
+    questions = [
         Question(
             id=1,
             question="Will it rain tomorrow?",
@@ -64,9 +65,12 @@ def fake_get_questions_by_id_list(question_ids):
             description="Predicting tomorrow's weather",
         ),
     ]
+    return {question.id: question for question in questions}
 
 
-def fake_get_questions(tag: str, limit: int = MAX_QUESTIONS) -> list[Question]:
+def fake_get_questions_for_tags(
+    tags: list[str], limit: int = MAX_QUESTIONS, refresh: bool = False
+) -> tuple[list[Question], float]:
     return [
         Question(
             id=1,
@@ -98,7 +102,7 @@ def fake_get_questions(tag: str, limit: int = MAX_QUESTIONS) -> list[Question]:
             end_date=datetime(2025, 4, 2),
             description="AIs future",
         ),
-    ]
+    ], time.time()
 
 
 @click.command
@@ -14,8 +14,8 @@ from polymarket_predictions_tally.integration import update_database
 from tests.database.test_perform_transaction import insert_position
 
 
-def fake_get_questions_by_id_list(question_ids):
-    return [
+def fake_get_questions_by_id_list(question_ids, tags=None):
+    questions = [
         Question(
             id=1,
             question="Will it rain tomorrow?",
@@ -37,6 +37,7 @@ def fake_get_questions_by_id_list(question_ids):
             description="Stock market prediction",
         ),
     ]
+    return {question.id: question for question in questions}
 
 
 @click.command
@@ -0,0 +1,51 @@
+import sqlite3
+import time
+from datetime import datetime
+from polymarket_predictions_tally.database.utils import load_sql_query
+from polymarket_predictions_tally.database.write import insert_question
+from polymarket_predictions_tally.integration import write_back_listing
+from polymarket_predictions_tally.logic import Question
+
+
+def test_cached_listing_is_not_written_back():
+    with sqlite3.connect(":memory:") as conn:
+        conn.executescript(load_sql_query("setup.sql"))
+        # what the last update stored
+        insert_question(
+            conn,
+            Question(
+                id=1,
+                question="Will it rain tomorrow?",
+                outcome_probs=[0.6, 0.4],
+                outcomes=["Yes", "No"],
+                tag="weather",
+                outcome=None,
+                end_date=datetime(2025, 4, 1),
+                description="Predicting tomorrow's weather",
+            ),
+        )
+        listed = Question(
+            id=1,
+            question="Will it rain tomorrow?",
+            outcome_probs=[0.5, 0.5],
+            outcomes=["Yes", "No"],
+            tag="weather",
+            outcome=None,
+            end_date=datetime(2025, 4, 1),
+            description="Predicting tomorrow's weather",
+        )
+        cursor = conn.cursor()
+        started_at = time.time()
+
+        # fetched before the session started, so it came from the disk cache
+        write_back_listing(conn, [listed], started_at - 60, started_at)
+        cursor.execute("SELECT outcome_probs FROM questions WHERE id = 1")
+        assert cursor.fetchone()[0] == "[0.6, 0.4]"
+        cursor.execute("SELECT COUNT(*) FROM price_snapshots")
+        assert cursor.fetchone()[0] == 0
+
+        write_back_listing(conn, [listed], started_at + 1, started_at)
+        cursor.execute("SELECT outcome_probs FROM questions WHERE id = 1")
+        assert cursor.fetchone()[0] == "[0.5, 0.5]"
+        cursor.execute("SELECT timestamp FROM price_snapshots")
+        assert cursor.fetchall() == [(int(started_at + 1),)]
@@ -1,6 +1,11 @@
 import requests
 import pytest
-from polymarket_predictions_tally.api import get_questions_by_id_list
+from polymarket_predictions_tally.api import (
+    get_question_from_entry,
+    get_questions_by_id_list,
+    iter_questions,
+    parse_market_entry,
+)
 
 
 # Create a fake response class that mimics the behavior of requests.Response
@@ -43,8 +48,8 @@ def test_get_questions_by_id_list(monkeypatch):
             "unaccessed_data": "whatever",
         },
         {
-            "id": 2,
-            "question": "Test Q2",
+            "id": 3,
+            "question": "Test Q3",
             "tag": "Politics",
             "outcome": "Yes",
             "outcomePrices": "[0.8, 0.2]",
@@ -54,28 +59,152 @@ def test_get_questions_by_id_list(monkeypatch):
         },
     ]
 
-    # Define a fake requests.get that returns our fake payload.
-    def fake_get(url, params):
+    # Define a fake Session.get that returns our fake payload.
+    def fake_get(self, url, params=None, **kwargs):
         # Optionally, you can assert that url and params are what you expect.
         assert url == "https://gamma-api.polymarket.com/markets"
         # For example, check that params is a list of tuples with "id" as key.
         # (We don't need to be too strict in the test unless you want to.)
         return FakeResponse(fake_payload, 200)
 
-    # Use monkeypatch to replace requests.get with our fake_get.
-    monkeypatch.setattr(requests, "get", fake_get)
+    # Use monkeypatch to replace the pooled session's get with our fake_get.
+    monkeypatch.setattr(requests.Session, "get", fake_get)
 
     # Call the function with a test id_list.
-    id_list = [1, 2]
+    id_list = [1, 2, 3]
     results = get_questions_by_id_list(id_list)
 
     # Now assert that the results are as expected.
-    assert isinstance(results, list)
+    assert isinstance(results, dict)
     assert len(results) == 3
     # Check that the first market has the expected question text.
-    assert not (results[0] is None)
-    assert results[0].question == "Test Q1"
+    assert not (results[1] is None)
+    assert results[1].question == "Test Q1"
     # And the second has the expected id.
-    assert not results[1] is None
-    assert results[1].id == 2
-    assert results[2] is None
+    assert not results[2] is None
+    assert results[2].id == 2
+    # The third has no end date so it can't be parsed
+    assert results[3] is None
+
+
+def test_get_questions_by_id_list_chunks(monkeypatch):
+    requested_chunks = []
+
+    def fake_get(self, url, params=None, **kwargs):
+        ids = [int(id) for key, id in params if key == "id"]
+        requested_chunks.append(ids)
+        # answer in reverse order to make sure results don't rely on it
+        return FakeResponse(
+            [
+                {
+                    "id": id,
+                    "question": f"Test Q{id}",
+                    "outcomePrices": "[0.8, 0.2]",
+                    "outcomes": '["Yes", "No"]',
+                    "endDate": "2025-02-14 00:00:00",
+                    "description": "desc",
+                }
+                for id in reversed(ids)
+            ]
+        )
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+
+    results = get_questions_by_id_list([1, 2, 3, 4, 5], chunk_size=2, max_concurrency=2)
+
+    assert sorted(len(chunk) for chunk in requested_chunks) == [1, 2, 2]
+    assert sorted(results) == [1, 2, 3, 4, 5]
+    for id, question in results.items():
+        assert question is not None
+        assert question.question == f"Test Q{id}"
+
+
+def test_get_questions_by_id_list_empty(monkeypatch):
+    def fake_get(self, url, params=None, **kwargs):
+        raise AssertionError("No request expected for an empty id list")
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+    assert get_questions_by_id_list([]) == {}
+
+
+def make_page(start: int, size: int) -> list[dict]:
+    return [
+        {
+            "id": id,
+            "question": f"Test Q{id}",
+            "active": True,
+            "outcomePrices": "[0.8, 0.2]",
+            "outcomes": '["Yes", "No"]',
+            "endDate": "2030-02-14 00:00:00",
+            "description": "desc",
+        }
+        for id in range(start, start + size)
+    ]
+
+
+def test_iter_questions_pages_until_short_page(monkeypatch):
+    requested = []
+    total = 7
+
+    def fake_get(self, url, params=None, **kwargs):
+        requested.append((params["offset"], params["limit"]))
+        size = max(0, min(params["limit"], total - params["offset"]))
+        return FakeResponse(make_page(params["offset"] + 1, size))
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+
+    ids = [question.id for question in iter_questions("Politics", page_size=3)]
+    assert ids == [1, 2, 3, 4, 5, 6, 7]
+    assert requested == [(0, 3), (3, 3), (6, 3)]
+
+
+def test_iter_questions_stops_at_max_items(monkeypatch):
+    requested = []
+
+    def fake_get(self, url, params=None, **kwargs):
+        requested.append((params["offset"], params["limit"]))
+        return FakeResponse(make_page(params["offset"] + 1, params["limit"]))
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+
+    questions = iter_questions("Politics", page_size=4, max_items=6)
+    first = next(questions)
+    # only the first page has been requested so far
+    assert first.id == 1
+    assert requested == [(0, 4)]
+    assert [question.id for question in questions] == [2, 3, 4, 5, 6]
+    assert requested == [(0, 4), (4, 2)]
+
+
+def test_parse_market_entry_decodes_fields_once():
+    entry = make_page(1, 1)[0]
+    entry["endDate"] = "2024-11-05T12:00:00Z"
+    entry["outcomePrices"] = '["0", "1"]'
+    entry["umaResolutionStatus"] = "resolved"
+
+    market = parse_market_entry(entry)
+    assert market.id == 1
+    assert market.outcome_prices == ["0", "1"]
+    assert market.outcomes == ["Yes", "No"]
+    assert market.end_date is not None and market.end_date.year == 2024
+
+    question = get_question_from_entry(entry, "Politics")
+    assert question is not None
+    assert question.outcome_probs == [0.0, 1.0]
+    assert question.outcome is False
+
+
+def test_get_question_from_entry_falls_back_to_end_date_iso():
+    entry = make_page(1, 1)[0]
+    del entry["endDate"]
+    entry["endDateIso"] = "2030-02-14"
+    question = get_question_from_entry(entry, "Politics")
+    assert question is not None
+    assert question.end_date.date().isoformat() == "2030-02-14"
+    assert question.outcome is None
+
+
+def test_get_question_from_entry_invalid_prices():
+    entry = make_page(1, 1)[0]
+    entry["outcomePrices"] = "not json"
+    assert get_question_from_entry(entry, "Politics") is None
@@ -0,0 +1,148 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from polymarket_predictions_tally import api, initialization
+
+
+def make_market(id: int) -> dict:
+    return {
+        "id": str(id),
+        "question": f"Test Q{id}",
+        "active": True,
+        "outcomePrices": '["0.8", "0.2"]',
+        "outcomes": '["Yes", "No"]',
+        "endDate": "2030-02-14T00:00:00Z",
+        "description": "desc",
+    }
+
+
+class StubGammaApi(BaseHTTPRequestHandler):
+    in_flight = 0
+    max_in_flight = 0
+    requests = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.requests += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        time.sleep(0.02)  # long enough for requests to overlap
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if url.path == "/markets" and "tag_id" in query:
+            # listings of neighbouring tags overlap by all but one market
+            first = int(query["tag_id"][0])
+            limit = int(query["limit"][0])
+            payload = [make_market(id) for id in range(first, first + limit)]
+        elif url.path == "/markets":
+            payload = [make_market(int(id)) for id in query["id"]]
+            if len(payload) == 1:
+                payload = payload[0]
+        else:
+            payload = {
+                "id": query["id"][0],
+                "title": "Test event",
+                "endDate": "2030-02-14T00:00:00Z",
+                "markets": [make_market(1), make_market(2)],
+            }
+        body = json.dumps(payload).encode()
+        with cls.lock:
+            cls.in_flight -= 1
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_api(monkeypatch, tmp_path):
+    monkeypatch.setattr(initialization, "CACHE_PATH", tmp_path / "api_cache.db")
+    StubGammaApi.in_flight = 0
+    StubGammaApi.max_in_flight = 0
+    StubGammaApi.requests = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubGammaApi)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(api, "GAMMA_API_URL", f"http://127.0.0.1:{server.server_port}")
+    yield StubGammaApi
+    server.shutdown()
+    server.server_close()
+
+
+def test_get_questions_by_id_list_bounded_concurrency(stub_api):
+    ids = list(range(1, 41))
+    questions = api.get_questions_by_id_list(ids, chunk_size=2, max_concurrency=3)
+
+    assert sorted(questions) == ids
+    assert all(question is not None for question in questions.values())
+    assert stub_api.requests == 20
+    assert 1 < stub_api.max_in_flight <= 3
+
+
+def test_get_questions_by_id_list_trailing_single_id_chunk(stub_api):
+    # the last chunk holds one id, which the api answers with a bare market
+    questions = api.get_questions_by_id_list([1, 2, 3], chunk_size=2)
+
+    assert sorted(questions) == [1, 2, 3]
+    assert all(question is not None for question in questions.values())
+
+
+def test_get_questions_sync_wrapper(stub_api):
+    questions = api.get_questions("Politics", limit=5)
+    assert [question.id for question in questions] == [2, 3, 4, 5, 6]
+
+
+def test_get_question_and_event_async(stub_api):
+    async def fetch():
+        semaphore = asyncio.Semaphore(2)
+        return await asyncio.gather(
+            api.get_question_async(7, "Politics", semaphore),
+            api.get_event_async(3, "Politics", semaphore),
+        )
+
+    question, event = asyncio.run(fetch())
+    assert question is not None
+    assert question.id == 7
+    assert event.id == 3
+    assert [question.id for question in event.questions] == [1, 2]
+
+
+def test_get_questions_for_tags_dedupes_markets(stub_api):
+    questions, _ = api.get_questions_for_tags(["Politics", "Sports"], limit=3)
+
+    assert stub_api.requests == 2
+    assert [question.id for question in questions] == [2, 3, 4, 1]
+    tags = {question.id: question.tag for question in questions}
+    assert tags == {1: "Sports", 2: "Politics", 3: "Politics", 4: "Politics"}
+
+
+def test_get_questions_for_tags_reports_cached_fetch_time(stub_api):
+    before = time.time()
+    _, fetched_at = api.get_questions_for_tags(["Politics"], limit=3)
+    assert fetched_at >= before
+
+    # served from the disk cache, so it keeps the time of the first fetch
+    _, cached_fetched_at = api.get_questions_for_tags(["Politics"], limit=3)
+    assert stub_api.requests == 1
+    assert cached_fetched_at == pytest.approx(fetched_at)
+
+    _, refreshed_at = api.get_questions_for_tags(["Politics"], limit=3, refresh=True)
+    assert refreshed_at > fetched_at
+
+
+def test_get_questions_by_id_list_keeps_stored_tags(stub_api):
+    questions = api.get_questions_by_id_list([1, 2], tags={1: "Sports"})
+    assert questions[1] is not None and questions[1].tag == "Sports"
+    assert questions[2] is not None and questions[2].tag == api.DEFAULT_TAG
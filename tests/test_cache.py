@@ -0,0 +1,109 @@
+import time
+import pytest
+import requests
+from polymarket_predictions_tally import api, cache, client, initialization
+
+
+@pytest.fixture(autouse=True)
+def cache_path(monkeypatch, tmp_path):
+    monkeypatch.setattr(initialization, "CACHE_PATH", tmp_path / "api_cache.db")
+
+
+def test_request_key_normalizes_params():
+    first = cache.request_key(
+        "https://x/markets", {"limit": 5, "tag_id": 2, "end_date_min": "2025-01-01"}
+    )
+    second = cache.request_key(
+        "https://x/markets", {"tag_id": "2", "end_date_min": "2026-01-01", "limit": "5"}
+    )
+    assert first == second
+    assert first != cache.request_key("https://x/events", {"limit": 5, "tag_id": 2})
+
+
+def test_get_respects_ttl():
+    cache.put("key", [{"id": 1}])
+    assert cache.get("key", ttl_seconds=60) == [{"id": 1}]
+    time.sleep(0.01)
+    assert cache.get("key", ttl_seconds=0.001) is None
+    assert cache.get("missing", ttl_seconds=60) is None
+
+
+def test_put_evicts_least_recently_used():
+    cache.put("a", 1, max_entries=2)
+    time.sleep(0.01)
+    cache.put("b", 2, max_entries=2)
+    time.sleep(0.01)
+    assert cache.get("a", ttl_seconds=60) == 1  # a is now more recent than b
+    time.sleep(0.01)
+    cache.put("c", 3, max_entries=2)
+    assert cache.get("a", ttl_seconds=60) == 1
+    assert cache.get("b", ttl_seconds=60) is None
+    assert cache.get("c", ttl_seconds=60) == 3
+
+
+def test_fetch_data_uses_cache_unless_refresh(monkeypatch):
+    calls = []
+
+    class FakeResponse:
+        status_code = 200
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return [{"id": len(calls)}]
+
+    def fake_get(self, url, params=None, **kwargs):
+        calls.append(params)
+        return FakeResponse()
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+    endpoint = "https://gamma-api.polymarket.com/markets"
+
+    assert api.fetch_data("Politics", endpoint, 5) == [{"id": 1}]
+    assert api.fetch_data("Politics", endpoint, 5) == [{"id": 1}]
+    assert len(calls) == 1
+    assert api.fetch_data("Politics", endpoint, 5, refresh=True) == [{"id": 2}]
+    assert len(calls) == 2
+    # the refreshed payload replaces the cached one
+    assert api.fetch_data("Politics", endpoint, 5) == [{"id": 2}]
+    assert len(calls) == 2
+
+
+def test_record_and_replay_bypass_the_cache(monkeypatch, tmp_path):
+    calls = []
+
+    class FakeResponse:
+        status_code = 200
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return [{"id": len(calls)}]
+
+    def fake_get(self, url, params=None, **kwargs):
+        calls.append(params)
+        return FakeResponse()
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+    monkeypatch.setenv(client.FIXTURES_DIR_VAR, str(tmp_path / "fixtures"))
+    endpoint = "https://gamma-api.polymarket.com/markets"
+
+    # warm the cache with a normal session
+    assert api.fetch_data("Politics", endpoint, 5) == [{"id": 1}]
+
+    # recording still goes to the network and writes the fixture
+    monkeypatch.setenv(client.API_MODE_VAR, "record")
+    assert api.fetch_data("Politics", endpoint, 5) == [{"id": 2}]
+    assert len(calls) == 2
+
+    # replay against a cold cache is served from the fixture and leaves the
+    # cache empty
+    monkeypatch.setattr(initialization, "CACHE_PATH", tmp_path / "cold_cache.db")
+    monkeypatch.setenv(client.API_MODE_VAR, "replay")
+    assert api.fetch_data("Politics", endpoint, 5) == [{"id": 2}]
+    assert len(calls) == 2
+    monkeypatch.delenv(client.API_MODE_VAR)
+    key = cache.request_key(endpoint, api.get_listing_params("Politics", 5))
+    assert cache.get(key) is None
@@ -0,0 +1,169 @@
+from concurrent.futures import ThreadPoolExecutor
+import time
+import requests
+from polymarket_predictions_tally import client
+
+
+def test_make_session_pools_connections():
+    session = client.make_session(pool_size=4)
+    adapter = session.get_adapter("https://gamma-api.polymarket.com/markets")
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 4
+    assert "gzip" in session.headers["Accept-Encoding"]
+    assert session.headers["Connection"] == "keep-alive"
+
+
+def test_get_session_is_shared():
+    client.close_session()
+    first = client.get_session()
+    second = client.get_session()
+    assert first is second
+    client.close_session()
+    assert client.get_session() is not first
+    client.close_session()
+
+
+def test_get_session_builds_one_session_across_threads(monkeypatch):
+    client.close_session()
+    make_session = client.make_session
+    built = []
+
+    def slow_make_session():
+        time.sleep(0.05)  # long enough for every thread to see no session
+        built.append(make_session())
+        return built[-1]
+
+    monkeypatch.setattr(client, "make_session", slow_make_session)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        sessions = list(executor.map(lambda _: client.get_session(), range(8)))
+
+    assert len(built) == 1
+    assert all(session is built[0] for session in sessions)
+    client.close_session()
+
+
+def test_get_json_uses_timeout(monkeypatch):
+    seen = {}
+
+    class FakeResponse:
+        status_code = 200
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return [{"id": 1}]
+
+    def fake_get(self, url, params=None, **kwargs):
+        seen["timeout"] = kwargs.get("timeout")
+        return FakeResponse()
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+    assert client.get_json("https://example.com", {"id": 1}) == [{"id": 1}]
+    assert seen["timeout"] == client.HTTP_TIMEOUT_SECONDS
+
+
+def test_record_then_replay(monkeypatch, tmp_path):
+    class FakeResponse:
+        status_code = 200
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return [{"id": 1, "question": "Recorded"}]
+
+    def fake_get(self, url, params=None, **kwargs):
+        return FakeResponse()
+
+    monkeypatch.setenv(client.FIXTURES_DIR_VAR, str(tmp_path))
+    monkeypatch.setenv(client.API_MODE_VAR, "record")
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+    params = {"id": 1, "end_date_min": "2025-01-01"}
+    recorded = client.get_json("https://example.com/markets", params)
+    assert len(list(tmp_path.iterdir())) == 1
+
+    def offline_get(self, url, params=None, **kwargs):
+        raise AssertionError("replay mode must not hit the network")
+
+    monkeypatch.setenv(client.API_MODE_VAR, "replay")
+    monkeypatch.setenv(client.REPLAY_LATENCY_VAR, "1")
+    monkeypatch.setattr(requests.Session, "get", offline_get)
+    # the moving date window is not part of the fixture key
+    params = {"id": 1, "end_date_min": "2026-01-01"}
+    assert client.get_json("https://example.com/markets", params) == recorded
+
+
+def test_replay_missing_fixture(monkeypatch, tmp_path):
+    monkeypatch.setenv(client.FIXTURES_DIR_VAR, str(tmp_path))
+    monkeypatch.setenv(client.API_MODE_VAR, "replay")
+    try:
+        client.get_json("https://example.com/markets", {"id": 2})
+    except client.MissingFixture:
+        return
+    raise AssertionError("Expected MissingFixture")
+
+
+class StatusResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code != 200:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+    def json(self):
+        return {"status": self.status_code}
+
+
+def test_get_json_retries_throttled_requests(monkeypatch):
+    responses = [
+        StatusResponse(429, {"Retry-After": "2"}),
+        StatusResponse(503),
+        StatusResponse(200),
+    ]
+    sleeps = []
+
+    def fake_get(self, url, params=None, **kwargs):
+        return responses.pop(0)
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+    monkeypatch.setattr(client.time, "sleep", sleeps.append)
+    client.reset_stats()
+
+    assert client.get_json("https://example.com") == {"status": 200}
+    assert client.stats.requests == 3
+    assert client.stats.retries == 2
+    # Retry-After is honoured, then the jittered exponential backoff applies
+    assert sleeps[0] == 2
+    assert client.HTTP_BACKOFF_BASE_SECONDS <= sleeps[1] * 2 <= (
+        client.HTTP_BACKOFF_BASE_SECONDS * 4
+    )
+
+
+def test_get_json_gives_up_after_max_retries(monkeypatch):
+    def fake_get(self, url, params=None, **kwargs):
+        return StatusResponse(500)
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+    monkeypatch.setattr(client.time, "sleep", lambda seconds: None)
+    client.reset_stats()
+
+    response = client.send_with_retries("https://example.com", None, max_retries=2)
+    assert response.status_code == 500
+    assert client.stats.requests == 3
+    assert client.stats.retries == 2
+
+
+def test_token_bucket_throttles_over_burst(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(client.time, "sleep", sleeps.append)
+    bucket = client.TokenBucket(rate=10, capacity=2)
+
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0
+    # the third and fourth callers wait for one and two refills
+    assert 0.05 < bucket.acquire() <= 0.1
+    assert 0.15 < bucket.acquire() <= 0.2
+    assert len(sleeps) == 2